@@ -623,19 +623,14 @@ def _write_skills(dest: Path, skills_content: str, overwrite: bool) -> str:
         return "created"
 
 
-@app.command()
-def onboard(
-    repo: str = typer.Option(".", help="Repository path"),
-    tools: list[str] = typer.Option(
-        ["codex", "copilot", "claude"], help="Target tools (codex, copilot, claude)"
-    ),
-    overwrite: bool = typer.Option(
-        False, "--overwrite", "-f", help="Replace existing lantern section"
-    ),
-) -> None:
-    """Set up AI coding tool instructions for Lantern."""
-    repo_path = Path(repo).resolve()
+def _onboard_tools(repo_path: Path, tools: list[str], overwrite: bool) -> dict[str, str]:
+    """Write the lantern skills section for each requested tool and report it.
+
+    Returns a mapping of tool name to the status from ``_write_skills``.
+    Unknown tool names are reported and left out of the mapping.
+    """
     skills_content = _load_skills_template()
+    statuses: dict[str, str] = {}
 
     for tool in tools:
         tool_key = tool.lower()
@@ -648,6 +643,7 @@ def onboard(
 
         dest = repo_path / TOOL_DESTINATIONS[tool_key]
         status = _write_skills(dest, skills_content, overwrite)
+        statuses[tool_key] = status
 
         status_colors = {
             "created": "green",
@@ -658,6 +654,21 @@ def onboard(
         color = status_colors[status]
         console.print(f"[{color}]{tool_key}: {status} → {dest}[/{color}]")
 
+    return statuses
+
+
+@app.command()
+def onboard(
+    repo: str = typer.Option(".", help="Repository path"),
+    tools: list[str] = typer.Option(
+        ["codex", "copilot", "claude"], help="Target tools (codex, copilot, claude)"
+    ),
+    overwrite: bool = typer.Option(
+        False, "--overwrite", "-f", help="Replace existing lantern section"
+    ),
+) -> None:
+    """Set up AI coding tool instructions for Lantern."""
+    _onboard_tools(Path(repo).resolve(), tools, overwrite)
     console.print("[bold green]Onboarding complete![/bold green]")
 
 
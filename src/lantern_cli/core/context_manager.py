@@ -12,12 +12,25 @@ Key improvements:
 """
 
 import logging
+import sys
 from dataclasses import asdict, dataclass, field
 from typing import Any, TypedDict
 
 logger = logging.getLogger(__name__)
 
 
+def _intern_graph(dependency_graph: dict[str, list[str]]) -> dict[str, list[str]]:
+    """Return a copy of *dependency_graph* with all file paths interned.
+
+    Paths recur across the graph, analyses, metadata and order list;
+    interning makes them share storage and compare by identity first.
+    """
+    return {
+        sys.intern(source): [sys.intern(dep) for dep in deps]
+        for source, deps in dependency_graph.items()
+    }
+
+
 class StructuredAnalysisResult(TypedDict):
     """
     Structured analysis result for a single file.
@@ -71,7 +84,7 @@ class EnhancedContextManager:
             dependency_graph: Graph of file dependencies {file -> [deps]}
             max_context_length: Maximum length of generated context
         """
-        self.dependency_graph = dependency_graph or {}
+        self.dependency_graph = _intern_graph(dependency_graph or {})
         self.max_context_length = max_context_length
 
         # Storage for structured analysis results
@@ -80,8 +93,9 @@ class EnhancedContextManager:
         # Quick lookup metadata
         self.file_metadata: dict[str, FileAnalysisMetadata] = {}
 
-        # Track analysis order
+        # Track analysis order, plus each file's first position for O(1) lookups
         self.analysis_order: list[str] = []
+        self._order_index: dict[str, int] = {}
 
     def store_analysis(
         self,
@@ -109,6 +123,8 @@ class EnhancedContextManager:
         """
         from datetime import datetime
 
+        file_path = sys.intern(file_path)
+
         # Get dependencies from graph
         dependencies = self.dependency_graph.get(file_path, [])
 
@@ -127,6 +143,7 @@ class EnhancedContextManager:
         }
 
         self.file_analyses[file_path] = result
+        self._order_index.setdefault(file_path, len(self.analysis_order))
         self.analysis_order.append(file_path)
 
         # Update metadata
@@ -145,6 +162,7 @@ class EnhancedContextManager:
         target_files: list[str],
         include_depth: int = 1,
         min_quality: float = 0.5,
+        alpha: float = 0.6,
     ) -> str:
         """
         Get relevant context for analyzing target files.
@@ -153,11 +171,16 @@ class EnhancedContextManager:
         1. Direct dependencies of target files
         2. Transitive dependencies (up to include_depth)
         3. Quality score threshold
+        4. Score-adaptive pruning relative to the best candidate
 
         Args:
             target_files: Files to be analyzed in current batch
             include_depth: How many levels of dependencies to include
             min_quality: Only include analyses with quality >= this
+            alpha: Drop candidates scoring below ``alpha * max_quality`` of
+                the selected set before the length budget is applied
+                (0 disables pruning). Only takes effect when
+                ``alpha * max_quality`` exceeds ``min_quality``
 
         Returns:
             Formatted context string (truncated to max_context_length)
@@ -169,22 +192,43 @@ class EnhancedContextManager:
             logger.debug(f"No relevant previous analyses for {target_files}")
             return ""
 
+        # Prune analyses that are weak relative to the best one, so the
+        # length budget is spent on the most reliable context
+        if alpha > 0:
+            best_quality = max(self.file_analyses[f]["quality_score"] for f in relevant_files)
+            threshold = alpha * best_quality
+            relevant_files = {
+                f for f in relevant_files if self.file_analyses[f]["quality_score"] >= threshold
+            }
+
         # Sort by dependency order (dependencies first)
         sorted_files = self._sort_by_dependency_order(relevant_files, target_files)
 
-        # Build context string
-        context_parts = []
+        # Build context string, formatting only as many analyses as the
+        # length budget can hold (anything past it would be truncated away)
+        context_parts: list[str] = []
+        joined_length = -2  # No "\n\n" separator before the first part
 
         for file_path in sorted_files:
-            if file_path in self.file_analyses:
-                analysis = self.file_analyses[file_path]
-                context_parts.append(self._format_analysis_for_context(file_path, analysis))
+            analysis = self.file_analyses.get(file_path)
+            if analysis is None:
+                continue
+
+            part = self._format_analysis_for_context(file_path, analysis)
+            context_parts.append(part)
+            joined_length += len(part) + 2
+            if joined_length > self.max_context_length:
+                break
 
         # Combine and truncate
         full_context = "\n\n".join(context_parts)
 
         if len(full_context) > self.max_context_length:
-            logger.info(f"Context truncated: {len(full_context)} → {self.max_context_length}")
+            skipped = len(sorted_files) - len(context_parts)
+            logger.info(
+                f"Context truncated to {self.max_context_length} chars "
+                f"({skipped} further analyses not formatted)"
+            )
             full_context = full_context[: self.max_context_length] + "\n... (truncated)"
 
         return full_context
@@ -203,35 +247,29 @@ class EnhancedContextManager:
         - Transitive dependencies (up to include_depth)
         - Files with sufficient quality scores
         """
-        relevant = set()
+        relevant: set[str] = set()
+
+        # Level-order walk: each file is expanded once, at its shallowest depth
+        frontier: list[str] = []
+        for target_file in target_files:
+            frontier.extend(self.dependency_graph.get(target_file, []))
 
-        def add_dependencies(files: list[str], depth: int) -> None:
-            if depth <= 0:
-                return
+        for _ in range(include_depth):
+            next_frontier: list[str] = []
 
-            for file_path in files:
+            for file_path in frontier:
                 if file_path in relevant:
                     continue
 
-                # Check if we have this analysis
-                if file_path not in self.file_analyses:
-                    continue
-
-                # Check quality threshold
-                analysis = self.file_analyses[file_path]
-                if analysis["quality_score"] < min_quality:
+                # Check if we have this analysis and it meets the quality threshold
+                analysis = self.file_analyses.get(file_path)
+                if analysis is None or analysis["quality_score"] < min_quality:
                     continue
 
                 relevant.add(file_path)
+                next_frontier.extend(analysis["dependencies"])
 
-                # Recursively add dependencies
-                deps = analysis["dependencies"]
-                add_dependencies(deps, depth - 1)
-
-        # Start with direct dependencies of target files
-        for target_file in target_files:
-            deps = self.dependency_graph.get(target_file, [])
-            add_dependencies(deps, include_depth)
+            frontier = next_frontier
 
         return relevant
 
@@ -243,6 +281,10 @@ class EnhancedContextManager:
         """
         sorted_files = []
         remaining = set(files)
+        unranked = len(self._order_index)
+
+        def by_analysis_order(file_path: str) -> tuple[int, str]:
+            return (self._order_index.get(file_path, unranked), file_path)
 
         while remaining:
             # Find files with no dependencies in remaining set
@@ -256,16 +298,10 @@ class EnhancedContextManager:
                 # Circular dependency or all unanalyzed deps
                 available = list(remaining)
 
-            # Add by analysis order
-            for f in self.analysis_order:
-                if f in available:
-                    sorted_files.append(f)
-                    remaining.remove(f)
-                    available.remove(f)
-
-            # Add any remaining (shouldn't happen normally)
+            # Add by analysis order (files never analyzed go last)
+            available.sort(key=by_analysis_order)
             sorted_files.extend(available)
-            remaining -= set(available)
+            remaining.difference_update(available)
 
         return sorted_files
 
@@ -346,15 +382,20 @@ class EnhancedContextManager:
         manager = cls(dependency_graph, max_context_length)
 
         # Restore file analyses
-        manager.file_analyses = data.get("file_analyses", {})
+        manager.file_analyses = {
+            sys.intern(file_path): analysis
+            for file_path, analysis in data.get("file_analyses", {}).items()
+        }
 
         # Restore metadata
         metadata_data = data.get("file_metadata", {})
         for file_path, meta_dict in metadata_data.items():
-            manager.file_metadata[file_path] = FileAnalysisMetadata(**meta_dict)
+            manager.file_metadata[sys.intern(file_path)] = FileAnalysisMetadata(**meta_dict)
 
         # Restore analysis order
-        manager.analysis_order = data.get("analysis_order", [])
+        manager.analysis_order = [sys.intern(p) for p in data.get("analysis_order", [])]
+        for position, file_path in enumerate(manager.analysis_order):
+            manager._order_index.setdefault(file_path, position)
 
         return manager
 
@@ -383,7 +424,7 @@ def prepare_batch_context(
     """
     # Ensure dependency graph is set
     if context_manager.dependency_graph != dependency_graph:
-        context_manager.dependency_graph = dependency_graph
+        context_manager.dependency_graph = _intern_graph(dependency_graph)
 
     # Get relevant context
     context = context_manager.get_relevant_context(batch_files, include_depth, min_quality)
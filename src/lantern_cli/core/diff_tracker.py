@@ -6,7 +6,9 @@ diff results with the dependency graph.
 """
 
 import logging
+import os
 import subprocess
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -15,7 +17,7 @@ from lantern_cli.static_analysis.dependency_graph import DependencyGraph
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class DiffResult:
     """Parsed result from `git diff --name-status`."""
 
@@ -25,7 +27,7 @@ class DiffResult:
     renamed: list[tuple[str, str]] = field(default_factory=list)  # (old_path, new_path)
 
 
-@dataclass
+@dataclass(slots=True)
 class ImpactSet:
     """Set of files affected by repository changes."""
 
@@ -110,7 +112,7 @@ class DiffTracker:
     def get_diff(self, base_sha: str) -> DiffResult:
         """Run ``git diff`` between *base_sha* and HEAD and parse the output.
 
-        Uses ``-M`` to detect renames.
+        Uses ``-M`` to detect renames and ``-z`` so paths arrive unquoted.
 
         Args:
             base_sha: Base commit SHA (e.g. stored from previous analysis).
@@ -123,14 +125,14 @@ class DiffTracker:
         """
         try:
             result = subprocess.run(
-                ["git", "diff", f"{base_sha}..HEAD", "--name-status", "-M"],
+                ["git", "diff", f"{base_sha}..HEAD", "--name-status", "-M", "-z"],
                 cwd=self.repo_path,
                 capture_output=True,
-                text=True,
                 timeout=30,
             )
             if result.returncode != 0:
-                raise RuntimeError(f"git diff failed: {result.stderr.strip()}")
+                stderr = result.stderr.decode(errors="replace").strip()
+                raise RuntimeError(f"git diff failed: {stderr}")
             return self._parse_name_status(result.stdout)
         except subprocess.SubprocessError as exc:
             raise RuntimeError(f"Failed to run git diff: {exc}") from exc
@@ -180,13 +182,21 @@ class DiffTracker:
             impact.reason[new_path] = f"renamed from {old_path}"
 
         # --- Level-1 reverse dependencies ---
+        reverse = dep_graph.reverse_dependencies
         directly_changed = set(impact.reanalyze)
-        for changed_file in directly_changed:
-            rev_deps = dep_graph.reverse_dependencies.get(changed_file, set())
-            for dep in rev_deps:
-                if dep not in impact.reanalyze and dep not in impact.remove:
-                    impact.reanalyze.add(dep)
-                    impact.reason[dep] = f"depends on changed file {changed_file}"
+        dependents = set().union(*(reverse.get(f, ()) for f in directly_changed))
+        dependents -= impact.reanalyze
+        dependents -= impact.remove
+        impact.reanalyze |= dependents
+
+        # Attribute each dependent to the first changed file (by path) it imports
+        for changed_file in sorted(directly_changed):
+            if not dependents:
+                break
+            attributed = dependents & reverse.get(changed_file, set())
+            for dep in attributed:
+                impact.reason[dep] = f"depends on changed file {changed_file}"
+            dependents -= attributed
 
         return impact
 
@@ -212,13 +222,18 @@ class DiffTracker:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _parse_name_status(output: str) -> DiffResult:
-        """Parse the output of ``git diff --name-status -M``.
+    def _parse_name_status(output: str | bytes) -> DiffResult:
+        """Parse the output of ``git diff --name-status -M -z``.
+
+        Records are NUL-separated tokens: a status followed by one path, or
+        by the old and new paths for renames and copies::
 
-        Each non-empty line has the format::
+            <status>\\0<path>\\0
+            R<score>\\0<old_path>\\0<new_path>\\0
 
-            <status>\\t<path>
-            R<score>\\t<old_path>\\t<new_path>
+        Paths are raw bytes (git does not quote them under ``-z``) and are
+        decoded individually as they are emitted, then interned to match the
+        dependency graph's node names.
 
         Args:
             output: Raw stdout from git diff.
@@ -226,31 +241,38 @@ class DiffTracker:
         Returns:
             Parsed DiffResult.
         """
+        if isinstance(output, str):
+            output = os.fsencode(output)
+
         result = DiffResult()
-        for line in output.strip().splitlines():
-            if not line.strip():
+        tokens = output.split(b"\0")
+        pos = 0
+        while pos < len(tokens):
+            status = tokens[pos]
+            if not status:
+                pos += 1
                 continue
-            parts = line.split("\t")
-            if len(parts) < 2:
-                logger.warning(f"Skipping unparsable git diff line: {line!r}")
+
+            kind = status[:1]
+            path_count = 2 if kind in (b"R", b"C") else 1
+            fields = tokens[pos + 1 : pos + 1 + path_count]
+            paths = [sys.intern(os.fsdecode(token)) for token in fields]
+            pos += 1 + path_count
+            if len(paths) < path_count or not all(paths):
+                logger.warning(f"Skipping truncated git diff record: {status!r} {paths!r}")
                 continue
 
-            status = parts[0]
-            if status == "A":
-                result.added.append(parts[1])
-            elif status == "M":
-                result.modified.append(parts[1])
-            elif status == "D":
-                result.deleted.append(parts[1])
-            elif status.startswith("R"):
-                if len(parts) >= 3:
-                    result.renamed.append((parts[1], parts[2]))
-                else:
-                    logger.warning(f"Rename line missing new path: {line!r}")
-            elif status.startswith("C"):
-                if len(parts) >= 3:
-                    result.added.append(parts[2])
+            if kind == b"A":
+                result.added.append(paths[0])
+            elif kind == b"M":
+                result.modified.append(paths[0])
+            elif kind == b"D":
+                result.deleted.append(paths[0])
+            elif kind == b"R":
+                result.renamed.append((paths[0], paths[1]))
+            elif kind == b"C":
+                result.added.append(paths[1])
             else:
-                logger.debug(f"Ignoring git diff status {status!r} for {parts[1:]}")
+                logger.debug(f"Ignoring git diff status {status!r} for {paths}")
 
         return result
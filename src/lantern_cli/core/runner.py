@@ -10,6 +10,7 @@ Architecture:
 import json
 import logging
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -31,6 +32,9 @@ logger = logging.getLogger(__name__)
 class Runner:
     """Orchestrates the analysis execution."""
 
+    # Upper bound on concurrent per-file fallback calls after a failed batch.
+    FALLBACK_MAX_WORKERS = 8
+
     def __init__(
         self,
         root_path: Path,
@@ -187,7 +191,7 @@ class Runner:
 
         Primary path uses structured batch analysis (`chain.batch`) to generate
         per-file output in one request set. If batch call fails, it falls back
-        to per-file invoke.
+        to per-file invoke, running up to ``FALLBACK_MAX_WORKERS`` calls at once.
 
         Returns:
             List of sense records (dicts with batch, file_path, and analysis data).
@@ -257,48 +261,56 @@ class Runner:
                     }
                 )
 
-            if any(
-                structured_results[i] is None
-                for i in range(len(batch.files))
-                if i not in empty_indices
-            ):
-                for orig_idx, item_data in non_empty_pairs:
-                    if structured_results[orig_idx] is not None:
-                        continue
-                    try:
-                        single = analyzer.analyze(
+            # Fallback: per-file analysis for anything the batch call did not
+            # return. Calls are network-bound, so they are issued concurrently.
+            pending = [
+                (orig_idx, item_data)
+                for orig_idx, item_data in non_empty_pairs
+                if structured_results[orig_idx] is None
+            ]
+            if pending:
+                workers = min(self.FALLBACK_MAX_WORKERS, len(pending))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(
+                            analyzer.analyze,
                             file_content=item_data["file_content"],
                             language=self.language,
                         )
-                        structured_results[orig_idx] = single
-                        sense_records.append(
-                            {
-                                "batch": batch.id,
-                                "file_index": orig_idx,
-                                "file_path": batch.files[orig_idx],
-                                "prompt": item_data,
-                                "raw_response": "fallback invocation",
-                                "analysis": single.model_dump(),
-                            }
-                        )
-                    except Exception as exc:
-                        logger.error(
-                            f"Structured fallback invoke failed for "
-                            f"{batch.files[orig_idx]}: {exc}"
-                        )
-                        sense_records.append(
-                            {
-                                "batch": batch.id,
-                                "file_index": orig_idx,
-                                "file_path": batch.files[orig_idx],
-                                "prompt": item_data,
-                                "raw_response": f"fallback error: {exc}",
-                                "analysis": {
-                                    "summary": "",
-                                    "key_insights": [],
-                                },
-                            }
-                        )
+                        for _, item_data in pending
+                    ]
+                    for (orig_idx, item_data), future in zip(pending, futures, strict=True):
+                        try:
+                            single = future.result()
+                            structured_results[orig_idx] = single
+                            sense_records.append(
+                                {
+                                    "batch": batch.id,
+                                    "file_index": orig_idx,
+                                    "file_path": batch.files[orig_idx],
+                                    "prompt": item_data,
+                                    "raw_response": "fallback invocation",
+                                    "analysis": single.model_dump(),
+                                }
+                            )
+                        except Exception as exc:
+                            logger.error(
+                                f"Structured fallback invoke failed for "
+                                f"{batch.files[orig_idx]}: {exc}"
+                            )
+                            sense_records.append(
+                                {
+                                    "batch": batch.id,
+                                    "file_index": orig_idx,
+                                    "file_path": batch.files[orig_idx],
+                                    "prompt": item_data,
+                                    "raw_response": f"fallback error: {exc}",
+                                    "analysis": {
+                                        "summary": "",
+                                        "key_insights": [],
+                                    },
+                                }
+                            )
 
         num_files = len(batch.files)
         sense_path = self.sense_dir / f"batch_{batch.id:04d}.sense"
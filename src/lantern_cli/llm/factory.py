@@ -19,9 +19,6 @@ from typing import TYPE_CHECKING, Any
 from lantern_cli.llm.backend import Backend
 from lantern_cli.llm.backends.cli_backend import CLIBackend
 from lantern_cli.llm.backends.langchain_backend import LangChainBackend
-from lantern_cli.llm.ollama import create_ollama_llm
-from lantern_cli.llm.openai import create_openai_chat
-from lantern_cli.llm.openrouter import create_openrouter_chat
 
 if TYPE_CHECKING:
     from lantern_cli.config.models import LanternConfig
@@ -54,7 +51,11 @@ def create_backend(config: LanternConfig, **kwargs: Any) -> Backend:
         )
 
     # ---- LangChain-based backends ----
+    # Provider modules are imported lazily so that only the selected
+    # provider's LangChain integration is loaded.
     if backend_config.type == "ollama":
+        from lantern_cli.llm.ollama import create_ollama_llm
+
         chat_model = create_ollama_llm(
             model=backend_config.ollama_model or "llama3",
             base_url=backend_config.ollama_url or "http://localhost:11434",
@@ -62,11 +63,15 @@ def create_backend(config: LanternConfig, **kwargs: Any) -> Backend:
         )
         model_name = backend_config.ollama_model or "llama3"
     elif backend_config.type == "openai":
+        from lantern_cli.llm.openai import create_openai_chat
+
         if backend_config.max_output_tokens:
             kwargs.setdefault("max_tokens", backend_config.max_output_tokens)
         chat_model = create_openai_chat(backend_config, **kwargs)
         model_name = backend_config.openai_model or "gpt-4o-mini"
     elif backend_config.type == "openrouter":
+        from lantern_cli.llm.openrouter import create_openrouter_chat
+
         if backend_config.max_output_tokens:
             kwargs.setdefault("max_tokens", backend_config.max_output_tokens)
         chat_model = create_openrouter_chat(backend_config, **kwargs)
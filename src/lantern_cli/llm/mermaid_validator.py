@@ -57,6 +57,14 @@ _HEADER_RE = re.compile(
     re.IGNORECASE,
 )
 
+# Case-insensitive view of _DIAGRAM_TYPES, keyed by lowercased keyword
+_REQUIRES_DIRECTION = {k.lower(): v for k, v in _DIAGRAM_TYPES.items()}
+
+# ```mermaid ... ``` or ``` ... ```
+_FENCE_RE = re.compile(r"^```(?:mermaid)?\s*\n?(.*?)\n?```\s*$", re.DOTALL | re.IGNORECASE)
+# Opening fence with no closing fence (truncated LLM output)
+_OPEN_FENCE_RE = re.compile(r"^```(?:mermaid)?\s*\n?(.*)", re.DOTALL | re.IGNORECASE)
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
@@ -75,17 +83,12 @@ def _strip_fences(raw: str) -> str:
     text = raw.strip()
 
     # Handle ```mermaid ... ``` or ``` ... ```
-    fence_pattern = re.compile(
-        r"^```(?:mermaid)?\s*\n?(.*?)\n?```\s*$",
-        re.DOTALL | re.IGNORECASE,
-    )
-    match = fence_pattern.match(text)
+    match = _FENCE_RE.match(text)
     if match:
         return match.group(1).strip()
 
     # Handle opening fence with no closing fence (truncated LLM output)
-    open_fence = re.compile(r"^```(?:mermaid)?\s*\n?(.*)", re.DOTALL | re.IGNORECASE)
-    match = open_fence.match(text)
+    match = _OPEN_FENCE_RE.match(text)
     if match:
         return match.group(1).rstrip("`").strip()
 
@@ -128,15 +131,7 @@ def _structural_validate(content: str) -> bool:
     keyword = match.group(1).lower()
 
     # Direction check for graph / flowchart
-    requires_direction = _DIAGRAM_TYPES.get(keyword, False)
-    if not requires_direction:
-        # Check case-insensitive key
-        for k, v in _DIAGRAM_TYPES.items():
-            if k.lower() == keyword:
-                requires_direction = v
-                break
-
-    if requires_direction:
+    if _REQUIRES_DIRECTION.get(keyword, False):
         # Expect "graph TD" or "flowchart LR" style
         rest = header[match.end() :].strip()
         direction = rest.split()[0].upper() if rest else ""
@@ -7,6 +7,11 @@ from pathlib import Path
 class CppAnalyzer:
     """Analyzer for C/C++ files parsing #include directives."""
 
+    # Match #include <header> or #include "header", capturing the content
+    # inside the brackets (group 1) or quotes (group 2). Compiled once and
+    # applied to raw bytes so large sources are never decoded wholesale.
+    _INCLUDE_RE = re.compile(rb'^\s*#\s*include\s+(?:<([^>]+)>|"([^"]+)")', re.MULTILINE)
+
     def analyze_imports(self, file_path: Path) -> list[str]:
         """Analyze includes in a C/C++ file.
 
@@ -20,21 +25,12 @@ class CppAnalyzer:
             return []
 
         try:
-            content = file_path.read_text(errors="ignore")
+            data = file_path.read_bytes()
         except Exception:
             return []
 
         includes = set()
-
-        # Match #include <header> or #include "header"
-        # We want to capture the content inside the quotes or brackets
-
-        # Regex for #include <...>
-        system_includes = re.findall(r"^\s*#\s*include\s+<([^>]+)>", content, re.MULTILINE)
-        includes.update(system_includes)
-
-        # Regex for #include "..."
-        local_includes = re.findall(r'^\s*#\s*include\s+"([^"]+)"', content, re.MULTILINE)
-        includes.update(local_includes)
+        for system_include, local_include in self._INCLUDE_RE.findall(data):
+            includes.add((system_include or local_include).decode("utf-8", errors="ignore"))
 
         return sorted(list(includes))
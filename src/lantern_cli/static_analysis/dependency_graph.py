@@ -2,26 +2,63 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+import logging
+import os
+import sys
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from lantern_cli.static_analysis.file_filter import FileFilter
 
+logger = logging.getLogger(__name__)
+
+
+def _parse_imports(job: tuple[Any, Path]) -> list[str] | None:
+    """Run one analyzer over one file.
+
+    Module-level so it can be pickled into worker processes.
+
+    Args:
+        job: ``(analyzer, file_path)`` pair; analyzer may be ``None``.
+
+    Returns:
+        Raw import strings, or ``None`` when no analyzer handles the file.
+    """
+    analyzer, file_path = job
+    if analyzer is None:
+        return None
+    imports: list[str] = analyzer.analyze_imports(file_path)
+    return imports
+
 
 class DependencyGraph:
     """Graph structure to represent module dependencies."""
 
-    def __init__(self, root_path: Path, file_filter: FileFilter) -> None:
+    # Below this many files, process start-up costs more than parsing saves.
+    PARALLEL_MIN_FILES = 256
+
+    def __init__(
+        self,
+        root_path: Path,
+        file_filter: FileFilter,
+        max_workers: int | None = None,
+    ) -> None:
         """Initialize DependencyGraph.
 
         Args:
             root_path: Root directory of the project.
             file_filter: FileFilter instance for ignoring files.
+            max_workers: Worker processes used to parse files during
+                ``build()``. ``None`` uses the CPU count; ``1`` parses
+                in-process.
         """
         self.root_path = root_path
         self.file_filter = file_filter
+        self.max_workers = max_workers
 
         # Map: Source -> Set of Targets
         self.dependencies: dict[str, set[str]] = defaultdict(set)
@@ -70,6 +107,8 @@ class DependencyGraph:
                 continue
 
             rel_path = path.relative_to(self.root_path)
+            # Interned so every map entry and graph edge shares one string per node
+            rel_str = sys.intern(str(rel_path))
 
             file_type = extensions[ext]
             all_files.append((rel_path, file_type))
@@ -79,38 +118,36 @@ class DependencyGraph:
                 # src/lantern_cli/main.py -> src.lantern_cli.main
                 module_parts = list(rel_path.parent.parts) + [rel_path.stem]
                 module_name = ".".join(module_parts)
-                module_map[module_name] = str(rel_path)
+                module_map[module_name] = rel_str
 
                 # Also support implicit src root if common pattern
                 if module_parts[0] == "src":
                     short_name = ".".join(module_parts[1:])
-                    module_map[short_name] = str(rel_path)
+                    module_map[short_name] = rel_str
             elif file_type == "cpp":
                 # For C++, we map filename (e.g. "utils.h") to path
                 # And also relative paths if possible
-                module_map[path.name] = str(rel_path)
+                module_map[path.name] = rel_str
                 # Map full relative path for precise includes
-                module_map[str(rel_path)] = str(rel_path)
+                module_map[rel_str] = rel_str
             elif file_type == "typescript":
                 # Map by relative path without extension (Node-style resolution)
                 no_ext = str(rel_path.with_suffix(""))
-                module_map[no_ext] = str(rel_path)
+                module_map[no_ext] = rel_str
                 # Map by filename without extension
-                module_map[rel_path.stem] = str(rel_path)
+                module_map[rel_path.stem] = rel_str
                 # Map full relative path with extension
-                module_map[str(rel_path)] = str(rel_path)
+                module_map[rel_str] = rel_str
 
         # 2. Analyze imports and build graph
-        for rel_path, file_type in all_files:
-            file_path = self.root_path / rel_path
+        parsed = self._parse_all_imports(all_files)
+        ts_resolved: dict[tuple[Path, str], str | None] = {}
 
-            analyzer = self.analyzers.get(file_type)
-            if not analyzer:
+        for (rel_path, file_type), imports in zip(all_files, parsed, strict=True):
+            if imports is None:
                 continue
 
-            imports = analyzer.analyze_imports(file_path)
-
-            source_node = str(rel_path)
+            source_node = sys.intern(str(rel_path))
             # Ensure node exists in graph even if no deps
             if source_node not in self.dependencies:
                 self.dependencies[source_node] = set()
@@ -137,42 +174,97 @@ class DependencyGraph:
                         pass
 
                 elif file_type == "typescript":
-                    # Skip bare module imports (node_modules packages)
-                    if not imp.startswith("."):
-                        target_file = module_map.get(imp)
+                    # Files in one directory share most import specifiers
+                    key = (rel_path.parent, imp)
+                    if key in ts_resolved:
+                        target_file = ts_resolved[key]
                     else:
-                        # Resolve relative import from the importing file's directory
-                        source_dir = rel_path.parent
-                        resolved = (source_dir / imp).as_posix()
-                        # Normalize path (handle ../)
-                        resolved = str(Path(resolved))
-
-                        # Try exact match first (e.g. import './foo.ts')
-                        target_file = module_map.get(resolved)
-
-                        # Strip extension for extensionless or .js->.ts resolution
-                        # (TypeScript ESM commonly uses .js in imports for .ts files)
-                        if not target_file:
-                            resolved_p = Path(resolved)
-                            if resolved_p.suffix in (".ts", ".tsx", ".js", ".jsx"):
-                                base = str(resolved_p.with_suffix(""))
-                            else:
-                                base = resolved
-                            for ext in (".ts", ".tsx", ".js", ".jsx"):
-                                target_file = module_map.get(base + ext)
-                                if target_file:
-                                    break
-
-                        # Try index file for directory imports
-                        if not target_file:
-                            for idx in ("index.ts", "index.js", "index.tsx", "index.jsx"):
-                                target_file = module_map.get(f"{resolved}/{idx}")
-                                if target_file:
-                                    break
+                        target_file = self._resolve_typescript_import(
+                            imp, rel_path.parent, module_map
+                        )
+                        ts_resolved[key] = target_file
 
                 if target_file and target_file != source_node:
                     self.add_dependency(source_node, target_file)
 
+    @staticmethod
+    def _resolve_typescript_import(
+        imp: str, source_dir: Path, module_map: dict[str, str]
+    ) -> str | None:
+        """Resolve a TypeScript/JavaScript import specifier to a project file.
+
+        Args:
+            imp: Import specifier as written (e.g. ``./utils``, ``react``).
+            source_dir: Directory of the importing file, relative to root.
+            module_map: Module names and paths mapped to project files.
+
+        Returns:
+            Relative path of the imported file, or None if it is not in the project.
+        """
+        # Skip bare module imports (node_modules packages)
+        if not imp.startswith("."):
+            return module_map.get(imp)
+
+        # Resolve relative import from the importing file's directory
+        resolved = (source_dir / imp).as_posix()
+        # Normalize path (handle ../)
+        resolved = str(Path(resolved))
+
+        # Try exact match first (e.g. import './foo.ts')
+        target_file = module_map.get(resolved)
+        if target_file:
+            return target_file
+
+        # Strip extension for extensionless or .js->.ts resolution
+        # (TypeScript ESM commonly uses .js in imports for .ts files)
+        resolved_p = Path(resolved)
+        if resolved_p.suffix in (".ts", ".tsx", ".js", ".jsx"):
+            base = str(resolved_p.with_suffix(""))
+        else:
+            base = resolved
+        for ext in (".ts", ".tsx", ".js", ".jsx"):
+            target_file = module_map.get(base + ext)
+            if target_file:
+                return target_file
+
+        # Try index file for directory imports
+        for idx in ("index.ts", "index.js", "index.tsx", "index.jsx"):
+            target_file = module_map.get(f"{resolved}/{idx}")
+            if target_file:
+                return target_file
+
+        return None
+
+    def _parse_all_imports(self, all_files: list[tuple[Path, str]]) -> list[list[str] | None]:
+        """Extract raw imports for every file, preserving input order.
+
+        Parsing is independent per file, so large repositories fan it out
+        over a process pool. Import resolution stays in the caller, where
+        the shared module map lives.
+
+        Args:
+            all_files: ``(rel_path, file_type)`` pairs from the indexing pass.
+
+        Returns:
+            One entry per file: its imports, or ``None`` if unsupported.
+        """
+        jobs = [
+            (self.analyzers.get(file_type), self.root_path / rel_path)
+            for rel_path, file_type in all_files
+        ]
+
+        # The CPU count only decides whether a pool is worth it; sizing is left
+        # to the executor so its platform caps apply when max_workers is None.
+        workers = self.max_workers if self.max_workers is not None else (os.cpu_count() or 1)
+        if workers > 1 and len(jobs) >= self.PARALLEL_MIN_FILES:
+            try:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                    return list(executor.map(_parse_imports, jobs, chunksize=64))
+            except (OSError, ValueError, BrokenProcessPool) as exc:
+                logger.warning(f"Parallel import parsing failed ({exc}); parsing sequentially")
+
+        return [_parse_imports(job) for job in jobs]
+
     def add_dependency(self, source: str, target: str) -> None:
         """Add a dependency: source depends on target.
 
@@ -180,6 +272,8 @@ class DependencyGraph:
             source: Source module name.
             target: Target module name.
         """
+        source = sys.intern(source)
+        target = sys.intern(target)
         self.dependencies[source].add(target)
         self.reverse_dependencies[target].add(source)
 
@@ -189,84 +283,144 @@ class DependencyGraph:
         Level 0: No outgoing dependencies (Leaf nodes).
         Level N: Max level of dependencies + 1.
 
+        Uses Kahn's algorithm over the reverse graph: each module keeps a
+        counter of unresolved dependencies and is emitted once it reaches
+        zero, so every edge is visited exactly once (O(V + E)).
+
         Returns:
-            Dict mapping module name to its level.
+            Dict mapping module name to its level. Modules that take part in
+            (or depend on) a cycle never resolve and get level -1.
         """
-        levels: dict[str, int] = {}
-        processed = set()
-
-        # Modules with no dependencies are level 0
         all_modules = set(self.dependencies.keys()) | set(self.reverse_dependencies.keys())
 
-        # Iterative calculation (simple approach for DAGs)
-        # Limitation: Circular deps might cause infinite loop if not handled.
-        # For MVP, we ignore cycles in level calculation or cap iterations.
+        # Number of dependencies whose level is still unknown
+        pending = {module: len(self.dependencies.get(module, ())) for module in all_modules}
 
         # Initialize leaves
-        for module in all_modules:
-            if not self.dependencies[module]:
-                levels[module] = 0
-                processed.add(module)
-
-        changed = True
-        max_iter = len(all_modules) + 2
-        iter_count = 0
-
-        while changed and iter_count < max_iter:
-            changed = False
-            iter_count += 1
-
-            for module in all_modules:
-                if module in levels:
-                    continue
-
-                # Check if all dependencies have levels calculated
-                deps = self.dependencies[module]
-                if all(d in levels for d in deps):
-                    max_dep_level = max(levels[d] for d in deps)
-                    levels[module] = max_dep_level + 1
-                    changed = True
-
-        # Assign -1 or max+1 for modules in cycles that couldn't be resolved
-        for module in all_modules:
-            if module not in levels:
+        levels: dict[str, int] = {module: 0 for module, count in pending.items() if count == 0}
+        queue = deque(levels)
+
+        while queue:
+            module = queue.popleft()
+            next_level = levels[module] + 1
+
+            for dependent in self.reverse_dependencies.get(module, ()):
+                if next_level > levels.get(dependent, 0):
+                    levels[dependent] = next_level
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    queue.append(dependent)
+
+        # Assign -1 for modules in cycles that couldn't be resolved
+        for module, count in pending.items():
+            if count > 0:
                 levels[module] = -1  # Indication of cycle participation or unresolved
 
         return levels
 
     def detect_cycles(self) -> list[list[str]]:
-        """Detect circular dependencies using DFS.
+        """Detect circular dependencies.
+
+        Strongly connected components are found in a single Tarjan pass, then
+        one shortest cycle through each component's first module is traced by
+        a BFS restricted to that component. Both steps are O(V + E) overall,
+        with no recursion limit. Every component with more than one module,
+        or a module that depends on itself, is reported once.
 
         Returns:
-            List of cycles (each cycle is a list of module names).
+            List of cycles, each closed by repeating its first module
+            (e.g. ``["A", "B", "A"]``).
         """
-        cycles = []
-        visited = set()
-        recursion_stack = set()
-        path = []
-
-        def dfs(node: str):
-            visited.add(node)
-            recursion_stack.add(node)
-            path.append(node)
-
-            for neighbor in self.dependencies[node]:
-                if neighbor not in visited:
-                    dfs(neighbor)
-                elif neighbor in recursion_stack:
-                    # Cycle found
-                    # Extract cycle path
-                    try:
-                        idx = path.index(neighbor)
-                        cycles.append(path[idx:] + [neighbor])
-                    except ValueError:
-                        pass  # Should not happen
-
-            recursion_stack.remove(node)
-            path.pop()
-
-        for node in list(self.dependencies.keys()):
-            if node not in visited:
-                dfs(node)
+        cycles: list[list[str]] = []
+
+        for component in self._tarjan_scc():
+            start = component[0]
+            if len(component) > 1:
+                cycles.append(self._shortest_cycle(start, set(component)))
+            elif start in self.dependencies.get(start, ()):
+                cycles.append([start, start])
 
         return cycles
+
+    def _tarjan_scc(self) -> list[list[str]]:
+        """Find strongly connected components with iterative Tarjan.
+
+        Returns:
+            Components in completion order; each lists its modules in
+            discovery order.
+        """
+        components: list[list[str]] = []
+        index: dict[str, int] = {}
+        lowlink: dict[str, int] = {}
+        stack: list[str] = []
+        on_stack: set[str] = set()
+
+        for root in list(self.dependencies.keys()):
+            if root in index:
+                continue
+
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.dependencies.get(root, ())))]
+
+            while work:
+                node, neighbors = work[-1]
+                for neighbor in neighbors:
+                    if neighbor not in index:
+                        # Descend into an unvisited neighbor
+                        index[neighbor] = lowlink[neighbor] = len(index)
+                        stack.append(neighbor)
+                        on_stack.add(neighbor)
+                        work.append((neighbor, iter(self.dependencies.get(neighbor, ()))))
+                        break
+                    if neighbor in on_stack:
+                        lowlink[node] = min(lowlink[node], index[neighbor])
+                else:
+                    # All neighbors done: propagate lowlink and pop component
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        component.reverse()
+                        components.append(component)
+
+        return components
+
+    def _shortest_cycle(self, start: str, members: set[str]) -> list[str]:
+        """Trace the shortest cycle through ``start`` inside one component.
+
+        Args:
+            start: Module the cycle begins and ends at.
+            members: Modules of the strongly connected component holding ``start``.
+
+        Returns:
+            The cycle as a closed path, e.g. ``["A", "B", "A"]``.
+        """
+        parents: dict[str, str] = {}
+        queue = deque([start])
+
+        while queue:
+            node = queue.popleft()
+            for neighbor in self.dependencies.get(node, ()):
+                if neighbor == start:
+                    path = [node]
+                    while path[-1] != start:
+                        path.append(parents[path[-1]])
+                    path.reverse()
+                    return path + [start]
+                if neighbor in members and neighbor not in parents:
+                    parents[neighbor] = node
+                    queue.append(neighbor)
+
+        # Unreachable for a real component; fall back to listing its members
+        return [start, *sorted(members - {start}), start]
@@ -1,5 +1,6 @@
 """File filtering logic using pathspec."""
 
+import os
 from collections.abc import Generator
 from pathlib import Path
 
@@ -97,13 +98,46 @@ class FileFilter:
 
         return False
 
+    def _should_prune(self, rel_dir: Path) -> bool:
+        """Check if a whole directory can be skipped during ``walk()``.
+
+        Excluded directories are not descended into. When include patterns
+        are configured, every directory is visited, since a force-included
+        file may live under an excluded one.
+
+        Args:
+            rel_dir: Directory path relative to root.
+
+        Returns:
+            True if nothing below the directory can be yielded.
+        """
+        if self.config.include:
+            return False
+
+        dir_str = f"{rel_dir}/"
+        return (
+            self.config_exclude_spec.match_file(dir_str)
+            or self.default_spec.match_file(dir_str)
+            or bool(self.gitignore_spec and self.gitignore_spec.match_file(dir_str))
+        )
+
     def walk(self) -> Generator[Path, None, None]:
         """Walk the directory tree and yield valid files.
 
+        Ignored directories (``node_modules/``, ``.git/``, ...) are pruned
+        instead of being listed file by file. Entries are visited in sorted
+        order.
+
         Yields:
             Path objects for valid files.
         """
-        for path in self.root_path.rglob("*"):
-            if path.is_file():
-                if not self.should_ignore(path):
+        for dirpath, dirnames, filenames in os.walk(self.root_path):
+            current = Path(dirpath)
+            rel_current = current.relative_to(self.root_path)
+
+            dirnames[:] = sorted(d for d in dirnames if not self._should_prune(rel_current / d))
+
+            for name in sorted(filenames):
+                path = current / name
+                if path.is_file() and not self.should_ignore(rel_current / name):
                     yield path
@@ -7,6 +7,15 @@ from pathlib import Path
 class TypeScriptAnalyzer:
     """Analyzer for TypeScript/JavaScript files parsing import statements."""
 
+    # Compiled once per process. The three forms are kept as separate patterns
+    # because an import match can span a later require() on the same line.
+    # ES module imports: import ... from '...', import '...'
+    _IMPORT_RE = re.compile(r"import\s+(?:.*from\s+)?['\"]([^'\"]+)['\"]")
+    # Re-exports: export ... from '...'
+    _EXPORT_RE = re.compile(r"export\s+(?:.*from\s+)?['\"]([^'\"]+)['\"]")
+    # CommonJS: require('...')
+    _REQUIRE_RE = re.compile(r"require\s*\(\s*['\"]([^'\"]+)['\"]\s*\)")
+
     def analyze_imports(self, file_path: Path) -> list[str]:
         """Analyze imports in a TypeScript/JavaScript file.
 
@@ -25,17 +34,8 @@ class TypeScriptAnalyzer:
             return []
 
         imports: set[str] = set()
-
-        # ES module imports: import ... from '...', import '...'
-        matches = re.findall(r"import\s+(?:.*from\s+)?['\"]([^'\"]+)['\"]", content)
-        imports.update(matches)
-
-        # Re-exports: export ... from '...'
-        export_matches = re.findall(r"export\s+(?:.*from\s+)?['\"]([^'\"]+)['\"]", content)
-        imports.update(export_matches)
-
-        # CommonJS: require('...')
-        require_matches = re.findall(r"require\s*\(\s*['\"]([^'\"]+)['\"]\s*\)", content)
-        imports.update(require_matches)
+        imports.update(self._IMPORT_RE.findall(content))
+        imports.update(self._EXPORT_RE.findall(content))
+        imports.update(self._REQUIRE_RE.findall(content))
 
         return sorted(list(imports))
@@ -624,25 +624,19 @@ class TestBuildPlanningGraph:
 class TestJsonExtraction:
     """Tests for JSON extraction helpers."""
 
-    def test_extract_json_array_plain(self) -> None:
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ('[["a.py", "b.py"], ["c.py"]]', [["a.py", "b.py"], ["c.py"]]),
+            ('Here are the groups:\n```json\n[["a.py"], ["b.py"]]\n```', [["a.py"], ["b.py"]]),
+            ('Based on my analysis:\n[["a.py", "b.py"]]', [["a.py", "b.py"]]),
+        ],
+        ids=["plain", "code_block", "preamble"],
+    )
+    def test_extract_json_array(self, text: str, expected: list[list[str]]) -> None:
         from lantern_cli.core.agentic_planner import _extract_json_array
 
-        result = _extract_json_array('[["a.py", "b.py"], ["c.py"]]')
-        assert result == [["a.py", "b.py"], ["c.py"]]
-
-    def test_extract_json_array_with_code_block(self) -> None:
-        from lantern_cli.core.agentic_planner import _extract_json_array
-
-        text = 'Here are the groups:\n```json\n[["a.py"], ["b.py"]]\n```'
-        result = _extract_json_array(text)
-        assert result == [["a.py"], ["b.py"]]
-
-    def test_extract_json_array_with_preamble(self) -> None:
-        from lantern_cli.core.agentic_planner import _extract_json_array
-
-        text = 'Based on my analysis:\n[["a.py", "b.py"]]'
-        result = _extract_json_array(text)
-        assert result == [["a.py", "b.py"]]
+        assert _extract_json_array(text) == expected
 
     def test_extract_json_array_invalid_raises(self) -> None:
         from lantern_cli.core.agentic_planner import _extract_json_array
@@ -650,18 +644,18 @@ class TestJsonExtraction:
         with pytest.raises(ValueError, match="Could not extract"):
             _extract_json_array("This has no JSON at all")
 
-    def test_extract_json_object_plain(self) -> None:
-        from lantern_cli.core.agentic_planner import _extract_json_object
-
-        result = _extract_json_object('{"0": "hint for batch 0"}')
-        assert result == {"0": "hint for batch 0"}
-
-    def test_extract_json_object_with_code_block(self) -> None:
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ('{"0": "hint for batch 0"}', {"0": "hint for batch 0"}),
+            ('```json\n{"0": "hint"}\n```', {"0": "hint"}),
+        ],
+        ids=["plain", "code_block"],
+    )
+    def test_extract_json_object(self, text: str, expected: dict[str, str]) -> None:
         from lantern_cli.core.agentic_planner import _extract_json_object
 
-        text = '```json\n{"0": "hint"}\n```'
-        result = _extract_json_object(text)
-        assert result == {"0": "hint"}
+        assert _extract_json_object(text) == expected
 
     def test_extract_json_object_invalid_raises(self) -> None:
         from lantern_cli.core.agentic_planner import _extract_json_object
@@ -1,3 +1,4 @@
+import re
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -8,44 +9,46 @@ from lantern_cli.llm.backends.cli_backend import CLIBackend
 from lantern_cli.llm.backends.langchain_backend import LangChainBackend
 from lantern_cli.llm.factory import create_backend
 
+_UNKNOWN_BACKEND_PATTERN = re.compile(r"Input should be")
+
 
 class TestBackendFactory:
-    """Test backend factory."""
+    """Test backend factory config handling."""
 
-    def test_create_api_not_implemented(self) -> None:
-        """API backend is not implemented yet."""
+    @pytest.mark.parametrize("api_provider", ["gemini", "openai", "anthropic"])
+    def test_create_api_not_implemented(self, api_provider: str) -> None:
+        """API backend is not implemented yet for any provider."""
         config = LanternConfig(
-            backend=BackendConfig(type="api", api_provider="gemini", api_model="custom-gemini")
+            backend=BackendConfig(type="api", api_provider=api_provider, api_model="custom")
         )
         with pytest.raises(NotImplementedError):
             create_backend(config)
 
     def test_create_unknown_backend(self) -> None:
         """Test creating unknown backend type raises ValidationError."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match=_UNKNOWN_BACKEND_PATTERN):
             BackendConfig(type="unknown-backend-type")  # type: ignore[arg-type]
 
-    def test_create_cli_backend(self) -> None:
-        """Test creating CLI backend."""
-        config = LanternConfig(
-            backend=BackendConfig(
-                type="cli",
-                cli_command="echo hello",
-                cli_model_name="test-cli",
-            )
-        )
-        backend = create_backend(config)
-        assert isinstance(backend, CLIBackend)
-        assert backend.model_name == "test-cli"
 
-    def test_create_cli_backend_defaults(self) -> None:
-        """Test CLI backend with default command."""
-        config = LanternConfig(backend=BackendConfig(type="cli"))
+class TestCreateBackend:
+    """Test backend instances returned by create_backend."""
+
+    @pytest.mark.parametrize(
+        "backend_kwargs, expected_model",
+        [
+            ({"cli_command": "echo hello", "cli_model_name": "test-cli"}, "test-cli"),
+            ({}, "cli"),
+        ],
+        ids=["explicit", "defaults"],
+    )
+    def test_create_cli_backend(self, backend_kwargs: dict[str, str], expected_model: str) -> None:
+        """Test creating CLI backend with explicit and default settings."""
+        config = LanternConfig(backend=BackendConfig(type="cli", **backend_kwargs))
         backend = create_backend(config)
         assert isinstance(backend, CLIBackend)
-        assert backend.model_name == "cli"
+        assert backend.model_name == expected_model
 
-    @patch("lantern_cli.llm.factory.create_ollama_llm")
+    @patch("lantern_cli.llm.ollama.create_ollama_llm")
     def test_create_ollama_returns_langchain_backend(self, mock_create: MagicMock) -> None:
         """Test that ollama type returns a LangChainBackend wrapper."""
         mock_create.return_value = MagicMock()
@@ -53,3 +56,17 @@ class TestBackendFactory:
         backend = create_backend(config)
         assert isinstance(backend, LangChainBackend)
         assert backend.model_name == "llama3"
+
+    @patch("lantern_cli.llm.ollama.create_ollama_llm")
+    def test_backend_reuses_chat_model_across_invocations(self, mock_create: MagicMock) -> None:
+        """The chat model (and its HTTP client pool) is built once per backend."""
+        chat_model = mock_create.return_value
+        chat_model.invoke.return_value = MagicMock(content="ok", usage_metadata=None)
+        config = LanternConfig(backend=BackendConfig(type="ollama", ollama_model="llama3"))
+
+        backend = create_backend(config)
+        for _ in range(5):
+            backend.invoke("x")
+
+        assert mock_create.call_count == 1
+        assert chat_model.invoke.call_count == 5
@@ -1,23 +1,37 @@
 """Tests for create_ollama_llm factory function."""
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, call, create_autospec, patch
 
 import pytest
+from langchain_ollama import ChatOllama
 
 from lantern_cli.llm.ollama import create_ollama_llm
 
+_EXPECTED_CHAT_CALL = call(model="qwen3:8b", base_url="http://localhost:11434", temperature=0)
 
-def test_create_ollama_llm_constructs_chatollama() -> None:
-    """create_ollama_llm returns ChatOllama instance."""
-    with patch("lantern_cli.llm.ollama.ChatOllama") as mock_chat:
-        llm = create_ollama_llm(model="qwen3:8b", base_url="http://localhost:11434")
 
-    assert llm is mock_chat.return_value
-    mock_chat.assert_called_once_with(
-        model="qwen3:8b",
-        base_url="http://localhost:11434",
-        temperature=0,
-    )
+@pytest.fixture
+def mock_chat_ollama(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace ChatOllama in the ollama factory module with an autospecced mock."""
+    mock_chat = create_autospec(ChatOllama, spec_set=True)
+    monkeypatch.setattr("lantern_cli.llm.ollama.ChatOllama", mock_chat)
+    return mock_chat
+
+
+@pytest.mark.parametrize(
+    "base_url",
+    ["http://localhost:11434", "http://localhost:11434/"],
+    ids=["plain", "trailing-slash"],
+)
+def test_create_ollama_llm_constructs_chatollama(
+    mock_chat_ollama: MagicMock, base_url: str
+) -> None:
+    """create_ollama_llm returns ChatOllama built with a stripped base_url."""
+    llm = create_ollama_llm(model="qwen3:8b", base_url=base_url)
+
+    assert llm is mock_chat_ollama.return_value
+    assert mock_chat_ollama.call_count == 1
+    assert mock_chat_ollama.call_args == _EXPECTED_CHAT_CALL
 
 
 def test_create_ollama_llm_raises_runtime_error_when_langchain_ollama_missing() -> None:
@@ -28,15 +42,3 @@ def test_create_ollama_llm_raises_runtime_error_when_langchain_ollama_missing()
     ):
         with pytest.raises(RuntimeError, match="pip install langchain-ollama"):
             create_ollama_llm(model="qwen3:8b", base_url="http://localhost:11434")
-
-
-def test_create_ollama_llm_trims_base_url() -> None:
-    """Use stripped base_url (without trailing slash)."""
-    with patch("lantern_cli.llm.ollama.ChatOllama") as mock_chat:
-        create_ollama_llm(model="qwen3:8b", base_url="http://localhost:11434/")
-
-    mock_chat.assert_called_once_with(
-        model="qwen3:8b",
-        base_url="http://localhost:11434",
-        temperature=0,
-    )
@@ -162,6 +162,26 @@ class TestEnhancedContextManager:
         assert "src/module.py" in relevant
         assert "src/base.py" in relevant
 
+    def test_find_relevant_files_expands_shared_dependency_at_shallowest_depth(self):
+        """A file reachable at depths 1 and 2 is still expanded from depth 1."""
+        # main -> {a, b}, a -> b, b -> c
+        manager = EnhancedContextManager(
+            {
+                "src/main.py": ["src/a.py", "src/b.py"],
+                "src/a.py": ["src/b.py"],
+                "src/b.py": ["src/c.py"],
+                "src/c.py": [],
+            }
+        )
+        for file_path in ("src/c.py", "src/b.py", "src/a.py"):
+            manager.store_analysis(file_path, "Summary", [], 1, 0.9)
+
+        relevant = manager._find_relevant_files(
+            target_files=["src/main.py"], include_depth=2, min_quality=0.5
+        )
+
+        assert relevant == {"src/a.py", "src/b.py", "src/c.py"}
+
     def test_find_relevant_files_quality_filtering(self, manager):
         """Test that low-quality analyses are filtered out."""
         manager.store_analysis("src/base.py", "Base", [], 1, quality_score=0.4)  # Below threshold
@@ -225,6 +245,19 @@ class TestEnhancedContextManager:
         assert len(context) <= 600  # max + truncation marker
         assert "(truncated)" in context or len(context) <= 500
 
+    def test_get_relevant_context_prunes_relative_to_best_quality(self):
+        """Candidates far below the best quality are pruned unless alpha is 0."""
+        manager = EnhancedContextManager({"src/main.py": ["src/strong.py", "src/weak.py"]})
+        manager.store_analysis("src/strong.py", "Strong", [], 1, quality_score=1.0)
+        manager.store_analysis("src/weak.py", "Weak", [], 1, quality_score=0.55)
+
+        pruned = manager.get_relevant_context(["src/main.py"], min_quality=0.5, alpha=0.6)
+        unpruned = manager.get_relevant_context(["src/main.py"], min_quality=0.5, alpha=0)
+
+        assert "src/strong.py" in pruned
+        assert "src/weak.py" not in pruned
+        assert "src/weak.py" in unpruned
+
     def test_get_statistics(self, manager):
         """Test getting statistics."""
         manager.store_analysis("src/file1.py", "Summary1", [], 1, quality_score=0.8)
@@ -295,6 +328,20 @@ class TestEnhancedContextManager:
         # base.py should come before module.py (module depends on base)
         assert sorted_files.index("src/base.py") < sorted_files.index("src/module.py")
 
+    def test_sort_independent_files_by_analysis_order(self):
+        """Independent files keep analysis order, also after a checkpoint round-trip."""
+        manager = EnhancedContextManager({})
+        manager.store_analysis("src/z.py", "Z", [], 1)
+        manager.store_analysis("src/a.py", "A", [], 1)
+        manager.store_analysis("src/z.py", "Z again", [], 2)
+
+        files = {"src/a.py", "src/z.py", "src/never_analyzed.py"}
+        expected = ["src/z.py", "src/a.py", "src/never_analyzed.py"]
+
+        assert manager._sort_by_dependency_order(files, []) == expected
+        restored = EnhancedContextManager.from_dict(manager.to_dict(), dependency_graph={})
+        assert restored._sort_by_dependency_order(files, []) == expected
+
     def test_format_analysis_for_context(self, manager):
         """Test formatting analysis for context inclusion."""
         analysis: StructuredAnalysisResult = {
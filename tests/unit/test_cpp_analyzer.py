@@ -1,15 +1,19 @@
 """Tests for C/C++ static analysis."""
 
+from pathlib import Path
 from unittest.mock import MagicMock
 
+import pytest
+
 from lantern_cli.static_analysis.cpp import CppAnalyzer
 from lantern_cli.static_analysis.dependency_graph import DependencyGraph
 
 
-def test_cpp_analyzer_extracts_includes(tmp_path):
-    """Test that CppAnalyzer correctly extracts includes."""
-    cpp_file = tmp_path / "main.cpp"
-    cpp_file.write_text("""
+@pytest.fixture(scope="session")
+def cpp_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the read-only C++ sample file once per session."""
+    path = tmp_path_factory.mktemp("cpp_single") / "main.cpp"
+    path.write_text("""
 #include <iostream>
 #include "utils.h"
 #include "core/config.hpp"
@@ -19,7 +23,22 @@ int main() {
     return 0;
 }
 """)
+    return path
+
+
+@pytest.fixture(scope="session")
+def cpp_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the read-only C++ sample project once per session."""
+    root = tmp_path_factory.mktemp("cpp_project")
+    (root / "src").mkdir()
+    (root / "src/main.cpp").write_text('#include "utils.h"\n#include "core.hpp"')
+    (root / "src/utils.h").write_text('#include "core.hpp"')
+    (root / "src/core.hpp").write_text("")
+    return root
 
+
+def test_cpp_analyzer_extracts_includes(cpp_file: Path) -> None:
+    """Test that CppAnalyzer correctly extracts includes."""
     analyzer = CppAnalyzer()
     includes = analyzer.analyze_imports(cpp_file)
 
@@ -30,29 +49,23 @@ int main() {
     assert len(includes) == 4
 
 
-def test_dependency_graph_builds_cpp_deps(tmp_path):
+def test_dependency_graph_builds_cpp_deps(cpp_project: Path) -> None:
     """Test that DependencyGraph correctly builds dependencies for C++ files."""
-    # Create a mock project structure
-    (tmp_path / "src").mkdir()
-    (tmp_path / "src/main.cpp").write_text('#include "utils.h"\n#include "core.hpp"')
-    (tmp_path / "src/utils.h").write_text('#include "core.hpp"')
-    (tmp_path / "src/core.hpp").write_text("")
-
     # Create mock file_filter that returns the files
     mock_filter = MagicMock()
     mock_filter.walk.return_value = [
-        tmp_path / "src/main.cpp",
-        tmp_path / "src/utils.h",
-        tmp_path / "src/core.hpp",
+        cpp_project / "src/main.cpp",
+        cpp_project / "src/utils.h",
+        cpp_project / "src/core.hpp",
     ]
 
-    graph = DependencyGraph(tmp_path, file_filter=mock_filter)
+    graph = DependencyGraph(cpp_project, file_filter=mock_filter)
     graph.build()
 
     deps = graph.dependencies
 
     # Check dependencies
-    # Paths are relative to tmp_path
+    # Paths are relative to cpp_project
     main_node = "src/main.cpp"
     utils_node = "src/utils.h"
     core_node = "src/core.hpp"
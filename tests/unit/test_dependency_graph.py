@@ -59,6 +59,33 @@ class TestDependencyGraph:
                 break
         assert found
 
+    def test_detect_cycles_reports_each_component_once(self, graph: DependencyGraph) -> None:
+        """Each strongly connected component is one cycle; long chains don't recurse."""
+        # Self-loop, a 2-cycle, and a long ring beyond the recursion limit
+        graph.add_dependency("S", "S")
+        graph.add_dependency("A", "B")
+        graph.add_dependency("B", "A")
+        ring = [f"n{i}" for i in range(5000)]
+        for source, target in zip(ring, ring[1:] + ring[:1], strict=True):
+            graph.add_dependency(source, target)
+
+        cycles = graph.detect_cycles()
+
+        assert sorted(len(set(cycle)) for cycle in cycles) == [1, 2, 5000]
+        assert all(cycle[0] == cycle[-1] for cycle in cycles)
+
+    def test_detect_cycles_returns_shortest_real_path(self, graph: DependencyGraph) -> None:
+        """The reported cycle follows actual edges and takes the shortest way back."""
+        # A -> B -> C -> A, plus the shortcut A -> C
+        graph.add_dependency("A", "B")
+        graph.add_dependency("B", "C")
+        graph.add_dependency("C", "A")
+        graph.add_dependency("A", "C")
+
+        cycles = graph.detect_cycles()
+
+        assert cycles == [["A", "C", "A"]]
+
     def test_complex_graph_metrics(self, graph: DependencyGraph) -> None:
         """Test complex graph metrics."""
         # A -> B, C
@@ -76,6 +103,20 @@ class TestDependencyGraph:
         assert layers["C"] == 1
         assert layers["A"] == 2
 
+    def test_layers_mark_cycles_unresolved(self, graph: DependencyGraph) -> None:
+        """Modules in or above a cycle get level -1; the rest are layered."""
+        # A -> B <-> C -> D
+        graph.add_dependency("A", "B")
+        graph.add_dependency("B", "C")
+        graph.add_dependency("C", "B")
+        graph.add_dependency("C", "D")
+
+        layers = graph.calculate_layers()
+        assert layers["D"] == 0
+        assert layers["B"] == -1
+        assert layers["C"] == -1
+        assert layers["A"] == -1
+
 
 class TestTypeScriptDependencyGraph:
     """Test DependencyGraph with TypeScript files."""
@@ -90,11 +131,9 @@ class TestTypeScriptDependencyGraph:
         (src / "component.tsx").write_text("import React from 'react';\n")
 
         mock_filter = MagicMock()
-        mock_filter.walk.return_value = [
-            src / "app.ts",
-            src / "utils.ts",
-            src / "component.tsx",
-        ]
+        mock_filter.walk.return_value = iter(
+            [src / "app.ts", src / "utils.ts", src / "component.tsx"]
+        )
 
         graph = DependencyGraph(root_path=tmp_path, file_filter=mock_filter)
         graph.build()
@@ -112,10 +151,7 @@ class TestTypeScriptDependencyGraph:
         (components / "Button.tsx").write_text("export const Button = () => {};\n")
 
         mock_filter = MagicMock()
-        mock_filter.walk.return_value = [
-            src / "app.ts",
-            components / "Button.tsx",
-        ]
+        mock_filter.walk.return_value = iter([src / "app.ts", components / "Button.tsx"])
 
         graph = DependencyGraph(root_path=tmp_path, file_filter=mock_filter)
         graph.build()
@@ -132,10 +168,7 @@ class TestTypeScriptDependencyGraph:
         (utils / "index.ts").write_text("export const helper = () => {};\n")
 
         mock_filter = MagicMock()
-        mock_filter.walk.return_value = [
-            src / "app.ts",
-            utils / "index.ts",
-        ]
+        mock_filter.walk.return_value = iter([src / "app.ts", utils / "index.ts"])
 
         graph = DependencyGraph(root_path=tmp_path, file_filter=mock_filter)
         graph.build()
@@ -148,10 +181,7 @@ class TestTypeScriptDependencyGraph:
         (tmp_path / "utils.js").write_text("module.exports = {};\n")
 
         mock_filter = MagicMock()
-        mock_filter.walk.return_value = [
-            tmp_path / "app.js",
-            tmp_path / "utils.js",
-        ]
+        mock_filter.walk.return_value = iter([tmp_path / "app.js", tmp_path / "utils.js"])
 
         graph = DependencyGraph(root_path=tmp_path, file_filter=mock_filter)
         graph.build()
@@ -163,7 +193,7 @@ class TestTypeScriptDependencyGraph:
         (tmp_path / "app.ts").write_text("import React from 'react';\n")
 
         mock_filter = MagicMock()
-        mock_filter.walk.return_value = [tmp_path / "app.ts"]
+        mock_filter.walk.return_value = iter([tmp_path / "app.ts"])
 
         graph = DependencyGraph(root_path=tmp_path, file_filter=mock_filter)
         graph.build()
@@ -178,12 +208,60 @@ class TestTypeScriptDependencyGraph:
         (src / "config.ts").write_text("export const config = {};\n")
 
         mock_filter = MagicMock()
-        mock_filter.walk.return_value = [
-            src / "app.ts",
-            src / "config.ts",
-        ]
+        mock_filter.walk.return_value = iter([src / "app.ts", src / "config.ts"])
 
         graph = DependencyGraph(root_path=tmp_path, file_filter=mock_filter)
         graph.build()
 
         assert "src/config.ts" in graph.dependencies["src/app.ts"]
+
+
+class TestParallelBuild:
+    """Test process-pool import parsing in DependencyGraph.build."""
+
+    def test_parallel_build_matches_sequential(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Parsing in worker processes yields the same graph as in-process parsing."""
+        (tmp_path / "main.py").write_text("import utils\n")
+        (tmp_path / "utils.py").write_text("")
+        (tmp_path / "core.cpp").write_text('#include "core.h"\n')
+        (tmp_path / "core.h").write_text("")
+        (tmp_path / "app.ts").write_text("import { x } from './lib';\n")
+        (tmp_path / "lib.ts").write_text("export const x = 1;\n")
+
+        mock_filter = MagicMock()
+        mock_filter.walk.return_value = sorted(tmp_path.iterdir())
+        monkeypatch.setattr(DependencyGraph, "PARALLEL_MIN_FILES", 0)
+
+        sequential = DependencyGraph(tmp_path, file_filter=mock_filter, max_workers=1)
+        sequential.build()
+        parallel = DependencyGraph(tmp_path, file_filter=mock_filter, max_workers=2)
+        parallel.build()
+
+        assert dict(parallel.dependencies) == dict(sequential.dependencies)
+        assert parallel.dependencies["main.py"] == {"utils.py"}
+        assert parallel.dependencies["core.cpp"] == {"core.h"}
+        assert parallel.dependencies["app.ts"] == {"lib.ts"}
+
+    def test_pool_setup_error_falls_back_to_sequential(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """An executor that rejects its worker count degrades to in-process parsing."""
+        (tmp_path / "main.py").write_text("import utils\n")
+        (tmp_path / "utils.py").write_text("")
+
+        def reject(*args: object, **kwargs: object) -> None:
+            raise ValueError("max_workers must be <= 61")
+
+        mock_filter = MagicMock()
+        mock_filter.walk.return_value = sorted(tmp_path.iterdir())
+        monkeypatch.setattr(DependencyGraph, "PARALLEL_MIN_FILES", 0)
+        monkeypatch.setattr(
+            "lantern_cli.static_analysis.dependency_graph.ProcessPoolExecutor", reject
+        )
+
+        graph = DependencyGraph(tmp_path, file_filter=mock_filter, max_workers=64)
+        graph.build()
+
+        assert graph.dependencies["main.py"] == {"utils.py"}
@@ -20,41 +20,41 @@ class TestParseNameStatus:
         assert result.renamed == []
 
     def test_added_files(self) -> None:
-        output = "A\tsrc/new_file.py\nA\tsrc/another.py\n"
+        output = "A\0src/new_file.py\0A\0src/another.py\0"
         result = DiffTracker._parse_name_status(output)
         assert result.added == ["src/new_file.py", "src/another.py"]
 
     def test_modified_files(self) -> None:
-        output = "M\tsrc/main.py\n"
+        output = "M\0src/main.py\0"
         result = DiffTracker._parse_name_status(output)
         assert result.modified == ["src/main.py"]
 
     def test_deleted_files(self) -> None:
-        output = "D\tsrc/old.py\n"
+        output = "D\0src/old.py\0"
         result = DiffTracker._parse_name_status(output)
         assert result.deleted == ["src/old.py"]
 
     def test_renamed_files(self) -> None:
-        output = "R100\tsrc/old.py\tsrc/new.py\n"
+        output = "R100\0src/old.py\0src/new.py\0"
         result = DiffTracker._parse_name_status(output)
         assert result.renamed == [("src/old.py", "src/new.py")]
 
     def test_renamed_with_similarity_score(self) -> None:
-        output = "R075\tsrc/old.py\tsrc/new.py\n"
+        output = "R075\0src/old.py\0src/new.py\0"
         result = DiffTracker._parse_name_status(output)
         assert result.renamed == [("src/old.py", "src/new.py")]
 
     def test_copy_treated_as_added(self) -> None:
-        output = "C100\tsrc/original.py\tsrc/copy.py\n"
+        output = "C100\0src/original.py\0src/copy.py\0"
         result = DiffTracker._parse_name_status(output)
         assert result.added == ["src/copy.py"]
 
     def test_mixed_statuses(self) -> None:
         output = (
-            "A\tsrc/new.py\n"
-            "M\tsrc/main.py\n"
-            "D\tsrc/old.py\n"
-            "R100\tsrc/before.py\tsrc/after.py\n"
+            "A\0src/new.py\0"
+            "M\0src/main.py\0"
+            "D\0src/old.py\0"
+            "R100\0src/before.py\0src/after.py\0"
         )
         result = DiffTracker._parse_name_status(output)
         assert result.added == ["src/new.py"]
@@ -62,16 +62,27 @@ class TestParseNameStatus:
         assert result.deleted == ["src/old.py"]
         assert result.renamed == [("src/before.py", "src/after.py")]
 
-    def test_unparsable_line_skipped(self) -> None:
-        output = "badline\nM\tsrc/main.py\n"
+    def test_unknown_status_skipped(self) -> None:
+        output = "T\0src/link.py\0M\0src/main.py\0"
         result = DiffTracker._parse_name_status(output)
         assert result.modified == ["src/main.py"]
 
     def test_rename_missing_new_path(self) -> None:
-        output = "R100\tsrc/old.py\n"
+        output = "R100\0src/old.py\0"
         result = DiffTracker._parse_name_status(output)
         assert result.renamed == []
 
+    def test_path_with_newline(self) -> None:
+        output = "M\0docs/odd\nname.md\0"
+        result = DiffTracker._parse_name_status(output)
+        assert result.modified == ["docs/odd\nname.md"]
+
+    def test_bytes_output(self) -> None:
+        output = "M\0src/caf\u00e9.py\0R100\0src/a.py\0src/b.py\0".encode()
+        result = DiffTracker._parse_name_status(output)
+        assert result.modified == ["src/caf\u00e9.py"]
+        assert result.renamed == [("src/a.py", "src/b.py")]
+
 
 class TestCalculateImpact:
     """Test DiffTracker.calculate_impact."""
@@ -137,6 +148,17 @@ class TestCalculateImpact:
         assert "src/main.py" in impact.reanalyze
         assert impact.reason["src/main.py"] == "depends on changed file src/utils.py"
 
+    def test_level1_reason_names_first_changed_dependency(
+        self, tracker: DiffTracker, dep_graph: DependencyGraph
+    ) -> None:
+        dep_graph.add_dependency("src/main.py", "src/helpers.py")
+        diff = DiffResult(modified=["src/utils.py", "src/helpers.py"])
+        impact = tracker.calculate_impact(diff, dep_graph)
+        assert impact.reanalyze == {"src/utils.py", "src/helpers.py", "src/main.py"}
+        # utils.py is itself modified, so it keeps its direct reason
+        assert impact.reason["src/utils.py"] == "modified"
+        assert impact.reason["src/main.py"] == "depends on changed file src/helpers.py"
+
     def test_standalone_file_no_cascade(
         self, tracker: DiffTracker, dep_graph: DependencyGraph
     ) -> None:
@@ -214,7 +236,7 @@ class TestGitOperations:
             assert tracker.commit_exists("nonexistent") is False
 
     def test_get_diff(self, tracker: DiffTracker) -> None:
-        diff_output = "M\tsrc/main.py\nA\tsrc/new.py\n"
+        diff_output = b"M\0src/main.py\0A\0src/new.py\0"
         with patch("subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(returncode=0, stdout=diff_output)
             result = tracker.get_diff("abc123")
@@ -223,6 +245,6 @@ class TestGitOperations:
 
     def test_get_diff_failure(self, tracker: DiffTracker) -> None:
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=128, stderr="fatal: bad object")
+            mock_run.return_value = MagicMock(returncode=128, stderr=b"fatal: bad object")
             with pytest.raises(RuntimeError, match="git diff failed"):
                 tracker.get_diff("badsha")
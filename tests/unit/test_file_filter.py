@@ -89,3 +89,41 @@ class TestFileFilter:
         )  # .gitignore itself is not ignored by default unless specified
         # node_modules should be ignored by default rules
         assert not any("node_modules" in f for f in rel_files)
+
+    def test_walk_skips_excluded_directories(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Excluded directories are pruned rather than filtered file by file."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "b.py").write_text("")
+        (tmp_path / "src" / "a.py").write_text("")
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "index.js").write_text("code")
+
+        file_filter = FileFilter(root_path=tmp_path, config=FilterConfig())
+        checked: list[Path] = []
+        original = file_filter.should_ignore
+
+        def recording_should_ignore(file_path: Path) -> bool:
+            checked.append(file_path)
+            return original(file_path)
+
+        monkeypatch.setattr(file_filter, "should_ignore", recording_should_ignore)
+
+        rel_files = [str(f.relative_to(tmp_path)) for f in file_filter.walk()]
+
+        assert rel_files == ["src/a.py", "src/b.py"]
+        assert not any("node_modules" in str(p) for p in checked)
+
+    def test_walk_include_reaches_excluded_directory(self, tmp_path: Path) -> None:
+        """Force-included files under an excluded directory are still found."""
+        (tmp_path / "build").mkdir()
+        (tmp_path / "build" / "keep.py").write_text("")
+        (tmp_path / "build" / "drop.py").write_text("")
+
+        config = FilterConfig(exclude=["build/"], include=["build/keep.py"])
+        file_filter = FileFilter(root_path=tmp_path, config=config)
+
+        rel_files = [str(f.relative_to(tmp_path)) for f in file_filter.walk()]
+
+        assert rel_files == ["build/keep.py"]
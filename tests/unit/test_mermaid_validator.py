@@ -1,10 +1,15 @@
 """Tests for Mermaid diagram validator."""
 
+from typing import Any
+
+import pytest
+
 from lantern_cli.llm.mermaid_validator import (
     _strip_fences,
     _structural_validate,
     clean_and_validate,
 )
+from lantern_cli.llm.structured import StructuredAnalysisOutput
 
 # ---------------------------------------------------------------------------
 # _strip_fences
@@ -59,136 +64,65 @@ class TestStripFences:
 # _structural_validate
 # ---------------------------------------------------------------------------
 
+# (id, content) pairs that must pass structural validation
+_VALID_STRUCTURES = (
+    ("graph_td", "graph TD\n    A --> B"),
+    ("graph_lr", "graph LR\n    A --> B"),
+    ("graph_rl", "graph RL\n    A --> B"),
+    ("graph_tb", "graph TB\n    A --> B"),
+    ("graph_bt", "graph BT\n    A --> B"),
+    ("flowchart_tb", "flowchart TB\n    A --> B"),
+    ("sequence_diagram", "sequenceDiagram\n    Alice->>Bob: Hello"),
+    ("class_diagram", "classDiagram\n    Animal <|-- Dog : inheritance"),
+    ("state_diagram", "stateDiagram\n    [*] --> Active"),
+    ("state_diagram_v2", "stateDiagram-v2\n    [*] --> Active"),
+    ("er_diagram", "erDiagram\n    CUSTOMER ||--o{ ORDER : places"),
+    ("gantt", "gantt\n    title A Gantt Diagram"),
+    ("pie", 'pie\n    title Key elements\n    "Calcium" : 42.96'),
+    ("mindmap", "mindmap\n    root((mindmap))"),
+    ("timeline", "timeline\n    title History"),
+    ("git_graph", "gitGraph\n    commit id: 'A'"),
+    ("journey", "journey\n    title My working day"),
+    # LLMs sometimes produce lowercase directions like 'graph td'
+    ("lowercase_direction", "graph td\n    A --> B"),
+    ("capitalised_keyword", "Graph TD\n    A --> B"),
+    ("flowchart_lowercase_direction", "flowchart lr\n    A --> B"),
+)
 
-class TestStructuralValidate:
-    """Tests for structural (regex-based) validation."""
-
-    def test_valid_graph_td(self) -> None:
-        """graph TD should be valid."""
-        assert _structural_validate("graph TD\n    A --> B") is True
-
-    def test_valid_graph_lr(self) -> None:
-        """graph LR should be valid."""
-        assert _structural_validate("graph LR\n    A --> B") is True
-
-    def test_valid_graph_rl(self) -> None:
-        """graph RL should be valid."""
-        assert _structural_validate("graph RL\n    A --> B") is True
-
-    def test_valid_graph_tb(self) -> None:
-        """graph TB should be valid."""
-        assert _structural_validate("graph TB\n    A --> B") is True
-
-    def test_valid_graph_bt(self) -> None:
-        """graph BT should be valid."""
-        assert _structural_validate("graph BT\n    A --> B") is True
-
-    def test_valid_flowchart_tb(self) -> None:
-        """flowchart TB should be valid."""
-        assert _structural_validate("flowchart TB\n    A --> B") is True
-
-    def test_valid_sequence_diagram(self) -> None:
-        """sequenceDiagram should be valid."""
-        content = "sequenceDiagram\n    Alice->>Bob: Hello"
-        assert _structural_validate(content) is True
-
-    def test_valid_class_diagram(self) -> None:
-        """classDiagram should be valid."""
-        content = "classDiagram\n    Animal <|-- Dog : inheritance"
-        assert _structural_validate(content) is True
-
-    def test_valid_state_diagram(self) -> None:
-        """stateDiagram should be valid."""
-        content = "stateDiagram\n    [*] --> Active"
-        assert _structural_validate(content) is True
-
-    def test_valid_state_diagram_v2(self) -> None:
-        """stateDiagram-v2 should be valid."""
-        content = "stateDiagram-v2\n    [*] --> Active"
-        assert _structural_validate(content) is True
-
-    def test_valid_er_diagram(self) -> None:
-        """erDiagram should be valid."""
-        content = "erDiagram\n    CUSTOMER ||--o{ ORDER : places"
-        assert _structural_validate(content) is True
-
-    def test_valid_gantt(self) -> None:
-        """gantt should be valid."""
-        content = "gantt\n    title A Gantt Diagram"
-        assert _structural_validate(content) is True
-
-    def test_valid_pie(self) -> None:
-        """pie should be valid."""
-        content = 'pie\n    title Key elements\n    "Calcium" : 42.96'
-        assert _structural_validate(content) is True
-
-    def test_valid_mindmap(self) -> None:
-        """mindmap should be valid."""
-        content = "mindmap\n    root((mindmap))"
-        assert _structural_validate(content) is True
+# (id, content) pairs that must fail structural validation
+_INVALID_STRUCTURES = (
+    ("empty", ""),
+    ("whitespace_only", "   \n   \n   "),
+    ("unknown_type", "weirdDiagram\n    A --> B"),
+    ("graph_missing_direction", "graph\n    A --> B"),
+    ("graph_wrong_direction", "graph XX\n    A --> B"),
+    ("header_only", "graph TD"),
+    ("header_only_trailing_newline", "graph TD\n"),
+    ("prose", "This is not a mermaid diagram."),
+    ("json", '{"type": "graph", "nodes": []}'),
+)
 
-    def test_valid_timeline(self) -> None:
-        """timeline should be valid."""
-        content = "timeline\n    title History"
-        assert _structural_validate(content) is True
 
-    def test_valid_git_graph(self) -> None:
-        """gitGraph should be valid."""
-        content = "gitGraph\n    commit id: 'A'"
-        assert _structural_validate(content) is True
+class TestStructuralValidate:
+    """Tests for structural (regex-based) validation."""
 
-    def test_valid_journey(self) -> None:
-        """journey diagram should be valid."""
-        content = "journey\n    title My working day"
+    @pytest.mark.parametrize(
+        "content",
+        [content for _, content in _VALID_STRUCTURES],
+        ids=[case_id for case_id, _ in _VALID_STRUCTURES],
+    )
+    def test_valid(self, content: str) -> None:
+        """Known diagram types with a body (and direction, if required) pass."""
         assert _structural_validate(content) is True
 
-    def test_empty_string_invalid(self) -> None:
-        """Empty string should fail validation."""
-        assert _structural_validate("") is False
-
-    def test_whitespace_only_invalid(self) -> None:
-        """Whitespace-only string should fail validation."""
-        assert _structural_validate("   \n   \n   ") is False
-
-    def test_unknown_type_invalid(self) -> None:
-        """Unknown diagram type should fail validation."""
-        assert _structural_validate("weirdDiagram\n    A --> B") is False
-
-    def test_graph_missing_direction_invalid(self) -> None:
-        """graph without direction should fail validation."""
-        assert _structural_validate("graph\n    A --> B") is False
-
-    def test_graph_wrong_direction_invalid(self) -> None:
-        """graph with invalid direction should fail validation."""
-        assert _structural_validate("graph XX\n    A --> B") is False
-
-    def test_header_only_no_body_invalid(self) -> None:
-        """Diagram with only header (no body) should fail."""
-        assert _structural_validate("graph TD") is False
-
-    def test_header_only_with_trailing_newline_invalid(self) -> None:
-        """Diagram header with newline only should fail."""
-        assert _structural_validate("graph TD\n") is False
-
-    def test_prose_text_invalid(self) -> None:
-        """Plain prose text should fail validation."""
-        assert _structural_validate("This is not a mermaid diagram.") is False
-
-    def test_json_content_invalid(self) -> None:
-        """JSON content should fail validation."""
-        assert _structural_validate('{"type": "graph", "nodes": []}') is False
-
-    def test_case_insensitive_direction(self) -> None:
-        """LLMs sometimes produce lowercase directions like 'graph td'."""
-        assert _structural_validate("graph td\n    A --> B") is True
-
-    def test_case_insensitive_keyword(self) -> None:
-        """Diagram keywords should be case-insensitive."""
-        assert _structural_validate("Graph TD\n    A --> B") is True
-
-    def test_flowchart_lowercase_direction(self) -> None:
-        """flowchart with lowercase direction should pass."""
-        assert _structural_validate("flowchart lr\n    A --> B") is True
+    @pytest.mark.parametrize(
+        "content",
+        [content for _, content in _INVALID_STRUCTURES],
+        ids=[case_id for case_id, _ in _INVALID_STRUCTURES],
+    )
+    def test_invalid(self, content: str) -> None:
+        """Empty, unknown, direction-less or body-less content fails."""
+        assert _structural_validate(content) is False
 
 
 # ---------------------------------------------------------------------------
@@ -261,19 +195,11 @@ class TestCleanAndValidate:
         assert result is not None
         assert "graph LR" in result
 
-    def test_all_valid_directions_accepted(self) -> None:
-        """All valid directions should be accepted for graph."""
-        for direction in ("TD", "TB", "LR", "RL", "BT"):
-            raw = f"graph {direction}\n    A --> B"
-            result = clean_and_validate(raw)
-            assert result is not None, f"Direction {direction} should be valid"
-
-    def test_all_flowchart_directions_accepted(self) -> None:
-        """All valid directions should be accepted for flowchart."""
-        for direction in ("TD", "TB", "LR", "RL", "BT"):
-            raw = f"flowchart {direction}\n    A --> B"
-            result = clean_and_validate(raw)
-            assert result is not None, f"flowchart {direction} should be valid"
+    @pytest.mark.parametrize("keyword", ["graph", "flowchart"])
+    @pytest.mark.parametrize("direction", ["TD", "TB", "LR", "RL", "BT"])
+    def test_direction_accepted(self, keyword: str, direction: str) -> None:
+        """Every valid direction should be accepted for graph and flowchart."""
+        assert clean_and_validate(f"{keyword} {direction}\n    A --> B") is not None
 
     def test_returns_string_not_none_for_valid(self) -> None:
         """Valid diagram should return string, not None."""
@@ -306,110 +232,69 @@ class TestCleanAndValidate:
 # Integration: normalize() now uses clean_and_validate
 # ---------------------------------------------------------------------------
 
+# A diagram that exceeds 2000 chars but is structurally valid
+_LONG_DIAGRAM = "graph TD\n" + "\n".join(f"    N{i} --> N{i+1}" for i in range(300))
+
+# One minimal diagram per documented diagram type
+_DIAGRAM_CASES = (
+    "graph TD\n    A --> B",
+    "flowchart LR\n    A --> B",
+    "sequenceDiagram\n    Alice->>Bob: Hi",
+    "classDiagram\n    A <|-- B",
+    "stateDiagram\n    [*] --> A",
+    "stateDiagram-v2\n    [*] --> A",
+    "erDiagram\n    A ||--o{ B : has",
+    "gantt\n    title A",
+    'pie\n    title A\n    "X" : 1',
+    "mindmap\n    root((A))",
+    "timeline\n    title A",
+)
+
+
+def _make_output(**overrides: Any) -> StructuredAnalysisOutput:
+    """Build a minimal StructuredAnalysisOutput with the given field overrides."""
+    return StructuredAnalysisOutput(summary="s", key_insights=[], language="en", **overrides)
+
 
 class TestNormalizeIntegration:
     """Verify that StructuredAnalysisOutput.normalize() calls clean_and_validate."""
 
     def test_valid_flow_diagram_preserved(self) -> None:
         """Valid flow_diagram should be preserved unchanged."""
-        from lantern_cli.llm.structured import StructuredAnalysisOutput
-
-        out = StructuredAnalysisOutput(
-            summary="s",
-            key_insights=[],
-            language="en",
-            flow_diagram="graph TD\n    A --> B",
-        )
+        out = _make_output(flow_diagram="graph TD\n    A --> B")
         assert out.flow_diagram == "graph TD\n    A --> B"
 
     def test_fenced_flow_diagram_cleaned(self) -> None:
         """Fenced flow_diagram should be cleaned (fences removed)."""
-        from lantern_cli.llm.structured import StructuredAnalysisOutput
-
-        out = StructuredAnalysisOutput(
-            summary="s",
-            key_insights=[],
-            language="en",
-            flow_diagram="```mermaid\ngraph TD\n    A --> B\n```",
-        )
+        out = _make_output(flow_diagram="```mermaid\ngraph TD\n    A --> B\n```")
         assert out.flow_diagram is not None
         assert "```" not in out.flow_diagram
         assert "graph TD" in out.flow_diagram
 
     def test_invalid_flow_diagram_set_to_none(self) -> None:
         """Invalid flow_diagram should be set to None."""
-        from lantern_cli.llm.structured import StructuredAnalysisOutput
-
-        out = StructuredAnalysisOutput(
-            summary="s",
-            key_insights=[],
-            language="en",
-            flow_diagram="This is not valid mermaid",
-        )
+        out = _make_output(flow_diagram="This is not valid mermaid")
         assert out.flow_diagram is None
 
     def test_missing_flow_diagram_stays_none(self) -> None:
         """Missing flow_diagram should stay None (default)."""
-        from lantern_cli.llm.structured import StructuredAnalysisOutput
-
-        out = StructuredAnalysisOutput(summary="s", key_insights=[], language="en")
+        out = _make_output()
         assert out.flow_diagram is None
 
     def test_empty_flow_diagram_set_to_none(self) -> None:
         """Empty flow_diagram should be set to None."""
-        from lantern_cli.llm.structured import StructuredAnalysisOutput
-
-        out = StructuredAnalysisOutput(
-            summary="s",
-            key_insights=[],
-            language="en",
-            flow_diagram="   ",
-        )
+        out = _make_output(flow_diagram="   ")
         assert out.flow_diagram is None
 
     def test_flow_diagram_length_capped_at_2000(self) -> None:
         """flow_diagram longer than 2000 chars should be capped."""
-        from lantern_cli.llm.structured import StructuredAnalysisOutput
-
-        # Build a diagram that exceeds 2000 chars but is structurally valid
-        body = "\n".join(f"    N{i} --> N{i+1}" for i in range(300))
-        long_diagram = f"graph TD\n{body}"
-        out = StructuredAnalysisOutput(
-            summary="s",
-            key_insights=[],
-            language="en",
-            flow_diagram=long_diagram,
-        )
+        out = _make_output(flow_diagram=_LONG_DIAGRAM)
         # Either truncated to 2000 or None (if truncation broke the body)
         if out.flow_diagram is not None:
             assert len(out.flow_diagram) <= 2000
 
-    def test_diagram_type_keywords_all_supported(self) -> None:
+    @pytest.mark.parametrize("diagram", _DIAGRAM_CASES, ids=lambda d: d.split("\n", 1)[0])
+    def test_diagram_type_keywords_all_supported(self, diagram: str) -> None:
         """All documented diagram types should work."""
-        from lantern_cli.llm.structured import StructuredAnalysisOutput
-
-        test_cases = [
-            ("graph TD\n    A --> B", True),
-            ("flowchart LR\n    A --> B", True),
-            ("sequenceDiagram\n    Alice->>Bob: Hi", True),
-            ("classDiagram\n    A <|-- B", True),
-            ("stateDiagram\n    [*] --> A", True),
-            ("stateDiagram-v2\n    [*] --> A", True),
-            ("erDiagram\n    A ||--o{ B : has", True),
-            ("gantt\n    title A", True),
-            ('pie\n    title A\n    "X" : 1', True),
-            ("mindmap\n    root((A))", True),
-            ("timeline\n    title A", True),
-        ]
-
-        for diagram, should_be_valid in test_cases:
-            out = StructuredAnalysisOutput(
-                summary="s",
-                key_insights=[],
-                language="en",
-                flow_diagram=diagram,
-            )
-            if should_be_valid:
-                assert out.flow_diagram is not None, f"Diagram should be valid: {diagram[:30]}"
-            else:
-                assert out.flow_diagram is None, f"Diagram should be invalid: {diagram[:30]}"
+        out = _make_output(flow_diagram=diagram)
+        assert out.flow_diagram is not None, f"Diagram should be valid: {diagram[:30]}"
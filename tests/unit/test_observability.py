@@ -1,11 +1,33 @@
 """Tests for LangSmith observability configuration."""
 
 import os
-from unittest.mock import patch
 
-from lantern_cli.config.models import LangSmithConfig
+import pytest
+
+from lantern_cli.config.models import LangSmithConfig, LanternConfig
 from lantern_cli.utils.observability import configure_langsmith
 
+# Variables written by configure_langsmith
+_LANGCHAIN_ENV_VARS = (
+    "LANGCHAIN_TRACING_V2",
+    "LANGCHAIN_API_KEY",
+    "LANGCHAIN_PROJECT",
+    "LANGCHAIN_ENDPOINT",
+)
+
+
+@pytest.fixture
+def langchain_env(monkeypatch: pytest.MonkeyPatch) -> pytest.MonkeyPatch:
+    """Start with the LangChain variables unset and restore them afterwards.
+
+    delenv alone records nothing for an unset key, so each variable is set
+    first; monkeypatch then also undoes what configure_langsmith writes.
+    """
+    for var in _LANGCHAIN_ENV_VARS:
+        monkeypatch.setenv(var, "")
+        monkeypatch.delenv(var)
+    return monkeypatch
+
 
 class TestConfigureLangsmith:
     """Test configure_langsmith function."""
@@ -15,13 +37,12 @@ class TestConfigureLangsmith:
         config = LangSmithConfig(enabled=False)
         assert configure_langsmith(config) is False
 
-    def test_enabled_without_api_key_returns_false(self) -> None:
+    def test_enabled_without_api_key_returns_false(self, langchain_env: pytest.MonkeyPatch) -> None:
         """When enabled but API key env var is not set, returns False."""
         config = LangSmithConfig(enabled=True, api_key_env="LANGCHAIN_API_KEY")
-        with patch.dict(os.environ, {}, clear=True):
-            assert configure_langsmith(config) is False
+        assert configure_langsmith(config) is False
 
-    def test_enabled_with_api_key_sets_env_vars(self) -> None:
+    def test_enabled_with_api_key_sets_env_vars(self, langchain_env: pytest.MonkeyPatch) -> None:
         """When enabled and API key is available, env vars are set correctly."""
         config = LangSmithConfig(
             enabled=True,
@@ -29,15 +50,15 @@ class TestConfigureLangsmith:
             project="test-project",
             endpoint="https://custom.endpoint.com",
         )
-        env = {"TEST_LANGSMITH_KEY": "lsv2_test_key_123"}
-        with patch.dict(os.environ, env, clear=True):
-            result = configure_langsmith(config)
+        langchain_env.setenv("TEST_LANGSMITH_KEY", "lsv2_test_key_123")
+
+        result = configure_langsmith(config)
 
-            assert result is True
-            assert os.environ["LANGCHAIN_TRACING_V2"] == "true"
-            assert os.environ["LANGCHAIN_API_KEY"] == "lsv2_test_key_123"
-            assert os.environ["LANGCHAIN_PROJECT"] == "test-project"
-            assert os.environ["LANGCHAIN_ENDPOINT"] == "https://custom.endpoint.com"
+        assert result is True
+        assert os.environ["LANGCHAIN_TRACING_V2"] == "true"
+        assert os.environ["LANGCHAIN_API_KEY"] == "lsv2_test_key_123"
+        assert os.environ["LANGCHAIN_PROJECT"] == "test-project"
+        assert os.environ["LANGCHAIN_ENDPOINT"] == "https://custom.endpoint.com"
 
     def test_default_config_values(self) -> None:
         """Test default LangSmithConfig values."""
@@ -53,16 +74,12 @@ class TestLangSmithConfigInLanternConfig:
 
     def test_default_langsmith_config(self) -> None:
         """LanternConfig should include a default LangSmithConfig."""
-        from lantern_cli.config.models import LanternConfig
-
         config = LanternConfig()
         assert isinstance(config.langsmith, LangSmithConfig)
         assert config.langsmith.enabled is False
 
     def test_custom_langsmith_config(self) -> None:
         """LanternConfig should accept custom LangSmithConfig."""
-        from lantern_cli.config.models import LanternConfig
-
         config = LanternConfig(
             langsmith=LangSmithConfig(
                 enabled=True,
@@ -2,16 +2,22 @@
 
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
 from lantern_cli.cli.main import (
     LANTERN_SECTION_END,
     LANTERN_SECTION_START,
     TOOL_DESTINATIONS,
+    _onboard_tools,
     app,
 )
 
-runner = CliRunner()
+
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    """CLI runner shared by the tests that check command output."""
+    return CliRunner()
 
 
 class TestOnboard:
@@ -19,8 +25,8 @@ class TestOnboard:
 
     def test_creates_all_tool_files(self, tmp_path: Path) -> None:
         """Test that onboard creates files for all tools."""
-        result = runner.invoke(app, ["onboard", "--repo", str(tmp_path)])
-        assert result.exit_code == 0
+        statuses = _onboard_tools(tmp_path, list(TOOL_DESTINATIONS), overwrite=False)
+        assert statuses == {tool: "created" for tool in TOOL_DESTINATIONS}
 
         for dest_rel in TOOL_DESTINATIONS.values():
             dest = tmp_path / dest_rel
@@ -31,8 +37,7 @@ class TestOnboard:
 
     def test_creates_single_tool_file(self, tmp_path: Path) -> None:
         """Test creating file for a single tool."""
-        result = runner.invoke(app, ["onboard", "--repo", str(tmp_path), "--tools", "codex"])
-        assert result.exit_code == 0
+        _onboard_tools(tmp_path, ["codex"], overwrite=False)
 
         assert (tmp_path / "AGENTS.md").exists()
         assert not (tmp_path / ".github" / "copilot-instructions.md").exists()
@@ -43,17 +48,17 @@ class TestOnboard:
         agents_md = tmp_path / "AGENTS.md"
         agents_md.write_text("# My Existing Instructions\n\nDo not delete this.\n")
 
-        result = runner.invoke(app, ["onboard", "--repo", str(tmp_path), "--tools", "codex"])
-        assert result.exit_code == 0
+        statuses = _onboard_tools(tmp_path, ["codex"], overwrite=False)
+        assert statuses == {"codex": "appended"}
 
         content = agents_md.read_text(encoding="utf-8")
         assert "# My Existing Instructions" in content
         assert "Do not delete this." in content
         assert LANTERN_SECTION_START in content
 
-    def test_idempotent_skips_existing_section(self, tmp_path: Path) -> None:
+    def test_idempotent_skips_existing_section(self, runner: CliRunner, tmp_path: Path) -> None:
         """Test that running twice doesn't duplicate the section."""
-        runner.invoke(app, ["onboard", "--repo", str(tmp_path), "--tools", "codex"])
+        _onboard_tools(tmp_path, ["codex"], overwrite=False)
         first_content = (tmp_path / "AGENTS.md").read_text(encoding="utf-8")
 
         result = runner.invoke(app, ["onboard", "--repo", str(tmp_path), "--tools", "codex"])
@@ -63,7 +68,7 @@ class TestOnboard:
         assert first_content == second_content
         assert "skipped" in result.output
 
-    def test_overwrite_replaces_existing_section(self, tmp_path: Path) -> None:
+    def test_overwrite_replaces_existing_section(self, runner: CliRunner, tmp_path: Path) -> None:
         """Test that --overwrite replaces the lantern section."""
         agents_md = tmp_path / "AGENTS.md"
         agents_md.write_text(
@@ -85,12 +90,21 @@ class TestOnboard:
 
     def test_creates_parent_directories(self, tmp_path: Path) -> None:
         """Test that .github/ directory is created for copilot."""
-        result = runner.invoke(app, ["onboard", "--repo", str(tmp_path), "--tools", "copilot"])
-        assert result.exit_code == 0
+        _onboard_tools(tmp_path, ["copilot"], overwrite=False)
         assert (tmp_path / ".github" / "copilot-instructions.md").exists()
 
-    def test_unknown_tool_reports_error(self, tmp_path: Path) -> None:
+    def test_unknown_tool_reports_error(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test that unknown tool names are reported."""
-        result = runner.invoke(app, ["onboard", "--repo", str(tmp_path), "--tools", "unknown"])
+        statuses = _onboard_tools(tmp_path, ["unknown"], overwrite=False)
+        assert statuses == {}
+        assert "Unknown tool" in capsys.readouterr().out
+
+    def test_cli_integration_smoke(self, runner: CliRunner, tmp_path: Path) -> None:
+        """The Typer command wires its default tools through to the files."""
+        result = runner.invoke(app, ["onboard", "--repo", str(tmp_path)])
         assert result.exit_code == 0
-        assert "Unknown tool" in result.output
+        assert "Onboarding complete!" in result.output
+        for dest_rel in TOOL_DESTINATIONS.values():
+            assert (tmp_path / dest_rel).exists()
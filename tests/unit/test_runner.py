@@ -5,7 +5,9 @@ Consolidates tests from:
 - test_runner_bottom_up_batch.py
 """
 
+import threading
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -27,6 +29,16 @@ def runner(mock_llm: MagicMock, mock_state_manager: MagicMock, tmp_path: Path) -
     )
 
 
+@pytest.fixture(scope="module")
+def runner_readonly(tmp_path_factory: pytest.TempPathFactory) -> Runner:
+    """Create one Runner shared by tests that never mutate it or its state."""
+    return Runner(
+        root_path=tmp_path_factory.mktemp("runner"),
+        backend=BackendMockFactory.create(),
+        state_manager=StateManagerMockFactory.create(),
+    )
+
+
 class TestRunBatchLifecycle:
     """Test Runner.run_batch execution lifecycle."""
 
@@ -75,35 +87,33 @@ class TestRunBatchLifecycle:
 class TestResponseExtraction:
     """Test Runner._extract_response_content method."""
 
-    def test_extract_string_content(self, runner: Runner) -> None:
-        """Test extracting simple string content."""
-        response = LLMResponse(content="Test summary")
-        result = runner._extract_response_content(response)
-        assert result == "Test summary"
-
-    def test_extract_list_content(self, runner: Runner) -> None:
-        """Test extracting list content."""
-        response = MagicMock(content=["Part 1", "Part 2"])
-        result = runner._extract_response_content(response)
-        assert result == "Part 1\nPart 2"
-
-    def test_extract_fails_on_empty_response(self, runner: Runner) -> None:
-        """Test extraction failure on empty response."""
-        response = None
-        with pytest.raises(ValueError, match="Empty response"):
-            runner._extract_response_content(response)
-
-    def test_extract_fails_on_empty_content(self, runner: Runner) -> None:
-        """Test extraction failure on empty content."""
-        response = LLMResponse(content="")
-        with pytest.raises(ValueError, match="empty"):
-            runner._extract_response_content(response)
-
-    def test_extract_fails_on_empty_list(self, runner: Runner) -> None:
-        """Test extraction failure on empty list."""
-        response = MagicMock(content=[])
-        with pytest.raises(ValueError, match="empty"):
-            runner._extract_response_content(response)
+    @pytest.mark.parametrize(
+        "response,expected",
+        [
+            (LLMResponse(content="Test summary"), "Test summary"),
+            (MagicMock(content=["Part 1", "Part 2"]), "Part 1\nPart 2"),
+        ],
+        ids=["string", "list"],
+    )
+    def test_extract_content(self, runner_readonly: Runner, response: Any, expected: str) -> None:
+        """String and list content are extracted as text."""
+        assert runner_readonly._extract_response_content(response) == expected
+
+    @pytest.mark.parametrize(
+        "response,match",
+        [
+            (None, "Empty response"),
+            (LLMResponse(content=""), "empty"),
+            (MagicMock(content=[]), "empty"),
+        ],
+        ids=["none", "empty_string", "empty_list"],
+    )
+    def test_extract_fails_on_empty(
+        self, runner_readonly: Runner, response: Any, match: str
+    ) -> None:
+        """Missing responses and empty content raise ValueError."""
+        with pytest.raises(ValueError, match=match):
+            runner_readonly._extract_response_content(response)
 
 
 class TestBottomUpDocGeneration:
@@ -189,3 +199,39 @@ class TestBottomUpDocGeneration:
         doc_a = (out_dir / "a.py.md").read_text(encoding="utf-8")
         assert "a.py" in doc_a
         assert "Analysis failed or not available." in doc_a
+
+    def test_generate_bottom_up_doc_fallback_runs_concurrently(self, tmp_path: Path) -> None:
+        """Per-file fallback calls are in flight together, and results keep file order."""
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "a.py").write_text("def a():\n    pass\n", encoding="utf-8")
+        (src / "b.py").write_text("def b():\n    pass\n", encoding="utf-8")
+
+        runner = Runner(
+            root_path=tmp_path,
+            backend=BackendMockFactory.create_batch([], has_metadata=True),
+            state_manager=StateManagerMockFactory.create(),
+        )
+        batch = Batch(id=4, files=[str(src / "a.py"), str(src / "b.py")])
+
+        # Sequential calls would never get both parties to the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def analyze(file_content: str, language: str) -> StructuredAnalysisOutput:
+            barrier.wait()
+            name = "A" if "def a" in file_content else "B"
+            return StructuredAnalysisOutput(
+                summary=f"{name} summary", key_insights=[], language=language
+            )
+
+        analyzer = MagicMock()
+        analyzer.analyze_batch.side_effect = RuntimeError("batch failed")
+        analyzer.analyze.side_effect = analyze
+
+        with patch("lantern_cli.core.runner.StructuredAnalyzer", return_value=analyzer):
+            records = runner._generate_bottom_up_doc(batch)
+
+        assert analyzer.analyze.call_count == 2
+        assert [r["analysis"]["summary"] for r in records] == ["A summary", "B summary"]
+        out_dir = tmp_path / ".lantern" / "output" / "en" / "bottom_up" / "src"
+        assert "B summary" in (out_dir / "b.py.md").read_text(encoding="utf-8")
@@ -11,6 +11,16 @@ from lantern_cli.llm.structured import (
     _extract_json,
 )
 
+# Canned backend payloads shared by the Mermaid repair tests.
+_VALID_TD_DIAGRAM = "graph TD\n    A --> B"
+_MINIMAL_PAYLOAD = {"summary": "s", "key_insights": []}
+
+
+def _payload_with_diagram(flow_diagram: str) -> dict[str, object]:
+    """Return a fresh minimal backend payload carrying *flow_diagram*."""
+    return {**_MINIMAL_PAYLOAD, "flow_diagram": flow_diagram}
+
+
 # ---------------------------------------------------------------------------
 # StructuredAnalysisOutput normalisation
 # ---------------------------------------------------------------------------
@@ -219,16 +229,12 @@ class TestMermaidRepair:
         # Second call (in repair): invoke returns valid diagram
         mock_backend = MagicMock()
         mock_backend.batch_invoke_structured.return_value = [
-            {
-                "summary": "s",
-                "key_insights": [],
-                "flow_diagram": "this is not valid mermaid",
-            }
+            _payload_with_diagram("this is not valid mermaid")
         ]
         from lantern_cli.llm.backend import LLMResponse
 
         mock_backend.invoke.return_value = LLMResponse(
-            content="graph TD\n    A --> B", usage_metadata=None
+            content=_VALID_TD_DIAGRAM, usage_metadata=None
         )
 
         analyzer = StructuredAnalyzer(backend=mock_backend)
@@ -237,17 +243,13 @@ class TestMermaidRepair:
         # Repair was triggered (invoke was called)
         assert mock_backend.invoke.called
         # flow_diagram should be set to the repaired value
-        assert interactions[0].analysis.flow_diagram == "graph TD\n    A --> B"
+        assert interactions[0].analysis.flow_diagram == _VALID_TD_DIAGRAM
 
     def test_repair_not_triggered_when_valid(self) -> None:
         """If flow_diagram is valid, don't trigger repair."""
         mock_backend = MagicMock()
         mock_backend.batch_invoke_structured.return_value = [
-            {
-                "summary": "s",
-                "key_insights": [],
-                "flow_diagram": "graph TD\n    A --> B",
-            }
+            _payload_with_diagram(_VALID_TD_DIAGRAM)
         ]
 
         analyzer = StructuredAnalyzer(backend=mock_backend)
@@ -256,12 +258,12 @@ class TestMermaidRepair:
         # Repair should NOT have been triggered
         assert not mock_backend.invoke.called
         # flow_diagram should be preserved
-        assert interactions[0].analysis.flow_diagram == "graph TD\n    A --> B"
+        assert interactions[0].analysis.flow_diagram == _VALID_TD_DIAGRAM
 
     def test_repair_not_triggered_when_absent(self) -> None:
         """If flow_diagram is absent, don't trigger repair."""
         mock_backend = MagicMock()
-        mock_backend.batch_invoke_structured.return_value = [{"summary": "s", "key_insights": []}]
+        mock_backend.batch_invoke_structured.return_value = [dict(_MINIMAL_PAYLOAD)]
 
         analyzer = StructuredAnalyzer(backend=mock_backend)
         interactions = analyzer.analyze_batch([{"file_content": "code", "language": "en"}])
@@ -276,11 +278,7 @@ class TestMermaidRepair:
 
         mock_backend = MagicMock()
         mock_backend.batch_invoke_structured.return_value = [
-            {
-                "summary": "s",
-                "key_insights": [],
-                "flow_diagram": "invalid mermaid",
-            }
+            _payload_with_diagram("invalid mermaid")
         ]
         # First repair attempt: invalid, second: valid
         mock_backend.invoke.side_effect = [
@@ -302,11 +300,7 @@ class TestMermaidRepair:
 
         mock_backend = MagicMock()
         mock_backend.batch_invoke_structured.return_value = [
-            {
-                "summary": "s",
-                "key_insights": [],
-                "flow_diagram": "invalid diagram",
-            }
+            _payload_with_diagram("invalid diagram")
         ]
         # All repair attempts return invalid content
         mock_backend.invoke.side_effect = [